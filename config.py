@@ -2,20 +2,52 @@
 Configuration settings for Property Management System
 """
 
+import numbers
 import os
-from datetime import timedelta
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Directory containing this file; resolved once at import and shared
+# by every path below
+_BASE_DIR = Path(__file__).resolve().parent
+
+# Naive UTC origin for epoch-second timestamps
+_EPOCH = datetime(1970, 1, 1)
 
 class Config:
     """Base configuration class"""
 
     # Database settings
-    DATABASE_PATH = os.path.join(os.path.dirname(__file__), 'database.db')
-    DATABASE_BACKUP_PATH = os.path.join(os.path.dirname(__file__), 'backups')
+    DATABASE_PATH = _BASE_DIR / 'database.db'
+    DATABASE_BACKUP_PATH = _BASE_DIR / 'backups'
+
+    # Schema script applied by init_db (see schemas/schema_v<N>.sql)
+    SCHEMA_DIR = _BASE_DIR / 'schemas'
+    SCHEMA_VERSION = 3
+
+    # SQLite connection tuning, applied to every new connection
+    SQLITE_PRAGMAS = {
+        'page_size': 8192,         # only takes effect before the file's first write
+        'synchronous': 'NORMAL',
+        'cache_size': -65536,      # 64 MiB page cache
+        'mmap_size': 268435456,    # 256 MiB memory-mapped I/O
+        'temp_store': 'MEMORY'
+    }
+    # Prepared statements kept per connection (sqlite3 defaults to 128)
+    SQLITE_CACHED_STATEMENTS = 256
 
     # Application settings
     APP_NAME = "Property Management System"
     APP_VERSION = "1.0.0"
     TIMEZONE = "Asia/Kuala_Lumpur"
+    # Database timestamps are stored in UTC and shifted for display
+    TIMEZONE_OFFSET_HOURS = 8
+    TIMEZONE_OFFSET = timedelta(hours=TIMEZONE_OFFSET_HOURS)
+
+    # Show per-function st.cache_data memory in the sidebar (DEBUG_CACHE=1)
+    DEBUG_CACHE = os.environ.get('DEBUG_CACHE') == '1'
 
     # Business rules
     DEFAULT_LEASE_EXPIRY_WARNING_DAYS = 30
@@ -74,6 +106,15 @@ class Config:
         'Administrator'
     ]
 
+    # Hashed views of the lists above for O(1) membership validation
+    TICKET_PRIORITIES_SET = frozenset(TICKET_PRIORITIES)
+    TICKET_CATEGORIES_SET = frozenset(TICKET_CATEGORIES)
+    PAYMENT_METHODS_SET = frozenset(PAYMENT_METHODS)
+    UNIT_STATUSES_SET = frozenset(UNIT_STATUSES)
+    LEASE_STATUSES_SET = frozenset(LEASE_STATUSES)
+    TICKET_STATUSES_SET = frozenset(TICKET_STATUSES)
+    AGENT_ROLES_SET = frozenset(AGENT_ROLES)
+
     # Currency settings
     CURRENCY_SYMBOL = 'RM'
     CURRENCY_CODE = 'MYR'
@@ -85,11 +126,61 @@ class Config:
     DISPLAY_DATETIME_FORMAT = '%d/%m/%Y %H:%M'
 
     # Reporting settings
-    REPORTS_PATH = os.path.join(os.path.dirname(__file__), 'reports')
+    REPORTS_PATH = _BASE_DIR / 'reports'
+
+    # Set once ensure_directories has created the directories above
+    _directories_ensured = False
+
+    @classmethod
+    def local_datetime(cls, timestamp) -> datetime:
+        """Local datetime for a stored UTC timestamp (epoch seconds or text)
+
+        Raises TypeError or ValueError for anything else.
+        """
+        if isinstance(timestamp, numbers.Integral):
+            utc_time = _EPOCH + timedelta(seconds=int(timestamp))
+        else:
+            utc_time = datetime.strptime(timestamp, cls.DATETIME_FORMAT)
+        return utc_time + cls.TIMEZONE_OFFSET
+
+    @classmethod
+    def connect(cls, db_path=None):
+        """Open an autocommit connection with SQLITE_PRAGMAS applied"""
+        conn = sqlite3.connect(db_path or cls.DATABASE_PATH,
+                               isolation_level=None,
+                               check_same_thread=False,
+                               cached_statements=cls.SQLITE_CACHED_STATEMENTS)
+        for name, value in cls.SQLITE_PRAGMAS.items():
+            conn.execute(f'PRAGMA {name}={value}')
+        return conn
+
+    @staticmethod
+    @contextmanager
+    def bulk_load(conn):
+        """Run a block in one transaction with foreign key checks deferred to COMMIT"""
+        conn.execute('BEGIN')
+        try:
+            conn.execute('PRAGMA defer_foreign_keys = ON')
+            yield conn
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+    @staticmethod
+    def close_connection(conn):
+        """Refresh query planner statistics, then close the connection"""
+        try:
+            conn.execute('PRAGMA optimize')
+        finally:
+            conn.close()
 
     @classmethod
     def ensure_directories(cls):
         """Ensure required directories exist"""
+        if cls._directories_ensured:
+            return
+
         directories = [
             cls.DATABASE_BACKUP_PATH,
             cls.REPORTS_PATH
@@ -97,6 +188,7 @@ class Config:
 
         for directory in directories:
             os.makedirs(directory, exist_ok=True)
+        cls._directories_ensured = True
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -121,3 +213,6 @@ config = {
     'testing': TestingConfig,
     'default': DevelopmentConfig
 }
+
+# Configuration class for this process, chosen once from APP_ENV
+ACTIVE_CONFIG = config.get(os.environ.get('APP_ENV', 'default'), DevelopmentConfig)
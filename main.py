@@ -6,473 +6,707 @@ Main application entry point
 
 import sqlite3
 import sys
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Tuple
 import json
 
-class DatabaseManager:
-    """Handles all database operations"""
-
-    def __init__(self, db_path: str = 'database.db'):
-        self.db_path = db_path
-        self.init_database()
-
-    def get_connection(self):
-        """Get database connection with foreign keys enabled"""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON;")
-        conn.row_factory = sqlite3.Row  # Enable dict-like access
-        return conn
+from config import ACTIVE_CONFIG as Config
+from init_db import apply_objects, create_schema
 
-    def init_database(self):
-        """Initialize database with schema and sample data"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        # Execute the schema
-        cursor.executescript("""
-        -- drop old tables if they exist
-        DROP TABLE IF EXISTS ticket_conversations;
-        DROP TABLE IF EXISTS ticket_comments;
-        DROP TABLE IF EXISTS service_tickets;
-        DROP TABLE IF EXISTS payments;
-        DROP TABLE IF EXISTS leases;
-        DROP TABLE IF EXISTS units;
-        DROP TABLE IF EXISTS agents;
-        DROP TABLE IF EXISTS properties;
-        DROP TABLE IF EXISTS tenants;
-
-        -- tenants
-        CREATE TABLE tenants (
-            id              INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp       DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours')),
-            first_name      TEXT    NOT NULL,
-            last_name       TEXT    NOT NULL,
-            email           TEXT    UNIQUE NOT NULL,
-            phone           TEXT,
-            date_of_birth   TEXT,
-            created_at      DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours'))
-        );
-
-        -- properties
-        CREATE TABLE properties (
-            id              INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp       DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours')),
-            name            TEXT    NOT NULL,
-            address_line1   TEXT    NOT NULL,
-            address_line2   TEXT,
-            city            TEXT    NOT NULL,
-            state           TEXT,
-            postal_code     TEXT,
-            country         TEXT    NOT NULL,
-            created_at      DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours'))
-        );
-
-        -- units
-        CREATE TABLE units (
-            id              INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp       DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours')),
-            property_id     INTEGER NOT NULL REFERENCES properties(id) ON DELETE CASCADE,
-            unit_number     TEXT    NOT NULL,
-            floor           TEXT,
-            bedrooms        INTEGER,
-            bathrooms       REAL,
-            square_feet     INTEGER,
-            status          TEXT    DEFAULT 'available',
-            created_at      DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours'))
-        );
-
-        -- leases
-        CREATE TABLE leases (
-            id              INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp       DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours')),
-            tenant_id       INTEGER NOT NULL REFERENCES tenants(id) ON DELETE CASCADE,
-            unit_id         INTEGER NOT NULL REFERENCES units(id) ON DELETE CASCADE,
-            start_date      DATETIME NOT NULL,
-            end_date        DATETIME NOT NULL,
-            rent_amount     REAL    NOT NULL,
-            security_deposit REAL,
-            status          TEXT    DEFAULT 'active',
-            created_at      DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours'))
-        );
-
-        -- agents
-        CREATE TABLE agents (
-            id              INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp       DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours')),
-            first_name      TEXT,
-            last_name       TEXT,
-            role            TEXT,
-            email           TEXT    UNIQUE,
-            phone           TEXT,
-            created_at      DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours'))
-        );
-
-        -- service tickets
-        CREATE TABLE service_tickets (
-            id              INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp       DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours')),
-            lease_id        INTEGER NOT NULL REFERENCES leases(id) ON DELETE CASCADE,
-            raised_by       INTEGER NOT NULL REFERENCES tenants(id) ON DELETE SET NULL,
-            assigned_to     INTEGER REFERENCES agents(id) ON DELETE SET NULL,
-            category        TEXT    NOT NULL,
-            subcategory     TEXT,
-            description     TEXT    NOT NULL,
-            status          TEXT    DEFAULT 'open',
-            priority        TEXT    DEFAULT 'normal',
-            created_at      DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours')),
-            updated_at      DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours'))
-        );
-
-        -- ticket comments
-        CREATE TABLE ticket_comments (
-            id              INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp       DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours')),
-            ticket_id       INTEGER NOT NULL REFERENCES service_tickets(id) ON DELETE CASCADE,
-            author_id       INTEGER NOT NULL,
-            author_type     TEXT    NOT NULL,
-            comment_text    TEXT    NOT NULL,
-            created_at      DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours'))
-        );
-
-        -- payments
-        CREATE TABLE payments (
-            id              INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp       DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours')),
-            lease_id        INTEGER NOT NULL REFERENCES leases(id) ON DELETE CASCADE,
-            payment_type    TEXT    NOT NULL,
-            billing_period  TEXT,
-            due_date        DATETIME,
-            amount          REAL    NOT NULL,
-            method          TEXT,
-            paid_on         DATETIME,
-            reference_number TEXT,
-            created_at      DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours'))
-        );
-
-        -- ticket conversations
-        CREATE TABLE ticket_conversations (
-            id              INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp       DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours')),
-            ticket_id       INTEGER NOT NULL REFERENCES service_tickets(id) ON DELETE CASCADE,
-            author_type     TEXT    NOT NULL,
-            author_id       INTEGER NOT NULL,
-            message_text    TEXT    NOT NULL,
-            sent_at         DATETIME NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now','+8 hours'))
-        );
-        """)
-
-        # Insert sample data
-        cursor.executescript("""
-        -- Tenants
-        INSERT INTO tenants (first_name, last_name, email, phone, date_of_birth) VALUES
+# Sample data inserted into an empty database: (table, columns, rows)
+SAMPLE_DATA = (
+    # Tenants
+    ('tenants', ('first_name', 'last_name', 'email', 'phone', 'date_of_birth'), [
         ('Alice', 'Tan',   'alice.tan@example.com',   '012-3456789', '1990-04-15'),
         ('Brian', 'Lee',   'brian.lee@example.com',   '013-2345678', '1985-11-22'),
         ('Clara', 'Wong',  'clara.wong@example.com',  '014-1234567', '1992-07-09'),
         ('David','Chong',  'david.chong@example.com', '015-9876543', '1988-02-28'),
-        ('Elaine','Ng',    'elaine.ng@example.com',   '016-8765432', '1995-12-05');
-
-        -- Properties
-        INSERT INTO properties (name, address_line1, address_line2, city, state, postal_code, country) VALUES
-        ('Sunset Apartments',  '10 Jalan Bukit',     NULL,            'Petaling Jaya', 'Selangor','46000','Malaysia'),
+        ('Elaine','Ng',    'elaine.ng@example.com',   '016-8765432', '1995-12-05'),
+    ]),
+    # Properties
+    ('properties', ('name', 'address_line1', 'address_line2', 'city', 'state', 'postal_code', 'country'), [
+        ('Sunset Apartments',  '10 Jalan Bukit',     None,             'Petaling Jaya', 'Selangor','46000','Malaysia'),
         ('Ocean View Condos',  '25 Jalan Pantai',    'Block B, Unit 12','Penang',      'Penang',  '10470','Malaysia'),
-        ('Hilltop Villas',     '5 Jalan Bukit Tinggi',NULL,            'Kuala Lumpur','KL','50450','Malaysia'),
-        ('Lakewood Homes',     '88 Lake Drive',       NULL,            'Ipoh',        'Perak',  '30000','Malaysia'),
-        ('Riverdale Towers',   '123 Riverside Rd',    'Tower A, 15th Fl','Kuantan',   'Pahang', '25000','Malaysia');
-
-        -- Units
-        INSERT INTO units (property_id, unit_number, floor, bedrooms, bathrooms, square_feet) VALUES
+        ('Hilltop Villas',     '5 Jalan Bukit Tinggi',None,             'Kuala Lumpur','KL','50450','Malaysia'),
+        ('Lakewood Homes',     '88 Lake Drive',       None,             'Ipoh',        'Perak',  '30000','Malaysia'),
+        ('Riverdale Towers',   '123 Riverside Rd',    'Tower A, 15th Fl','Kuantan',   'Pahang', '25000','Malaysia'),
+    ]),
+    # Units
+    ('units', ('property_id', 'unit_number', 'floor', 'bedrooms', 'bathrooms', 'square_feet'), [
         (1, 'A-01',  '1', 2, 1.5,  850),
         (1, 'B-03',  '2', 3, 2.0, 1200),
         (2, 'B-12', '12', 1, 1.0,  600),
         (3, 'V-05',  '1', 4, 3.0, 2000),
-        (5, 'T-150','15', 2, 2.0,  900);
-
-        -- Leases
-        INSERT INTO leases (tenant_id, unit_id, start_date, end_date, rent_amount, security_deposit) VALUES
+        (5, 'T-150','15', 2, 2.0,  900),
+    ]),
+    # Leases
+    ('leases', ('tenant_id', 'unit_id', 'start_date', 'end_date', 'rent_amount', 'security_deposit'), [
         (1, 1, '2025-01-01','2025-12-31', 1500.00, 1500.00),
         (2, 2, '2025-03-15','2026-03-14', 2100.00, 2100.00),
         (3, 3, '2025-05-01','2026-04-30',  800.00,  800.00),
         (4, 4, '2025-02-01','2025-07-31', 3200.00, 3200.00),
-        (5, 5, '2025-06-01','2026-05-31', 1200.00, 1200.00);
-
-        -- Agents
-        INSERT INTO agents (first_name, last_name, role, email, phone) VALUES
+        (5, 5, '2025-06-01','2026-05-31', 1200.00, 1200.00),
+    ]),
+    # Agents
+    ('agents', ('first_name', 'last_name', 'role', 'email', 'phone'), [
         ('Farah','Iskandar','Manager',   'farah.iskandar@example.com','017-1234567'),
         ('Gavin','Lim',     'Technician','gavin.lim@example.com',    '018-2345678'),
         ('Han',  'Yeo',     'Clerk',     'han.yeo@example.com',      '019-3456789'),
         ('Irene','Chew',    'Supervisor','irene.chew@example.com',   '010-4567890'),
-        ('Jamal','Omar',    'Technician','jamal.omar@example.com',   '011-5678901');
-
-        -- Service Tickets
-        INSERT INTO service_tickets (lease_id, raised_by, assigned_to, category, subcategory, description, priority) VALUES
+        ('Jamal','Omar',    'Technician','jamal.omar@example.com',   '011-5678901'),
+    ]),
+    # Service Tickets
+    ('service_tickets', ('lease_id', 'raised_by', 'assigned_to', 'category', 'subcategory', 'description', 'priority'), [
         (1, 1, 2, 'Maintenance','Plumbing',   'Leaking faucet in kitchen',       'high'),
-        (2, 2, 3, 'Billing',    'Invoice',    'Dispute on last month''s invoice', 'normal'),
-        (3, 3, NULL,'Maintenance','Electrical','Living room light flickering',   'high'),
+        (2, 2, 3, 'Billing',    'Invoice',    "Dispute on last month's invoice", 'normal'),
+        (3, 3, None,'Maintenance','Electrical','Living room light flickering',   'high'),
         (4, 4, 5, 'Inquiries',  'General',    'How to renew lease online?',      'low'),
-        (5, 5, 4, 'Maintenance','Painting',   'Wall paint peeling in bedroom',   'normal');
-
-        -- Ticket Comments
-        INSERT INTO ticket_comments (ticket_id, author_id, author_type, comment_text) VALUES
+        (5, 5, 4, 'Maintenance','Painting',   'Wall paint peeling in bedroom',   'normal'),
+    ]),
+    # Ticket Comments
+    ('ticket_comments', ('ticket_id', 'author_id', 'author_type', 'comment_text'), [
         (1, 2, 'agent',  'I have scheduled a plumber for tomorrow.'),
         (1, 1, 'tenant', 'Thanks—please let me know the time.'),
         (2, 3, 'agent',  'Please provide the invoice number.'),
         (3, 3, 'agent',  'Electrician will arrive this afternoon.'),
-        (4, 5, 'agent',  'You can renew via our website under "My Account."');
-
-        -- Payments
-        INSERT INTO payments (lease_id, payment_type, billing_period, due_date, amount, method, paid_on, reference_number) VALUES
+        (4, 5, 'agent',  'You can renew via our website under "My Account."'),
+    ]),
+    # Payments
+    ('payments', ('lease_id', 'payment_type', 'billing_period', 'due_date', 'amount', 'method', 'paid_on', 'reference_number'), [
         (1, 'rent',       '2025-06','2025-06-05',1500.00,'bank_transfer','2025-06-03 10:15:00','BTX123456'),
         (2, 'electricity','2025-05','2025-05-20', 120.50,'credit_card',  '2025-05-18 14:22:00','CC987654'),
-        (3, 'water',      '2025-05','2025-05-25',  45.75,'bank_transfer', NULL,                NULL),
+        (3, 'water',      '2025-05','2025-05-25',  45.75,'bank_transfer', None,                 None),
         (4, 'rent',       '2025-06','2025-06-01',3200.00,'credit_card',  '2025-05-30 09:00:00','CC112233'),
-        (5, 'rent',       '2025-06','2025-06-07',1200.00,'bank_transfer','2025-06-06 11:45:00','BTX778899');
-
-        -- Ticket Conversations
-        INSERT INTO ticket_conversations (ticket_id, author_type, author_id, message_text) VALUES
+        (5, 'rent',       '2025-06','2025-06-07',1200.00,'bank_transfer','2025-06-06 11:45:00','BTX778899'),
+    ]),
+    # Ticket Conversations
+    ('ticket_conversations', ('ticket_id', 'author_type', 'author_id', 'message_text'), [
         (1, 'agent',  2, 'Plumber ETA: 9am tomorrow.'),
-        (1, 'tenant', 1, 'Okay, I''ll be home by then.'),
+        (1, 'tenant', 1, "Okay, I'll be home by then."),
         (2, 'agent',  3, 'Awaiting invoice details.'),
         (5, 'agent',  4, 'Painting crew scheduled Friday.'),
-        (3, 'agent',  3, 'Electric switch replaced.');
-        """)
+        (3, 'agent',  3, 'Electric switch replaced.'),
+    ]),
+)
+
+# SQL used by PropertyManager, kept as constants so every call passes the
+# same string to the connection's prepared-statement cache
+_SQL_ALL_TENANTS = "SELECT * FROM tenants ORDER BY last_name, first_name"
+
+_SQL_TENANT_BY_ID = "SELECT * FROM tenants WHERE id = ?"
+
+_SQL_ADD_TENANT = """
+    INSERT INTO tenants (first_name, last_name, email, phone, date_of_birth)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_ALL_PROPERTIES = """
+    SELECT p.*, COUNT(u.id) as unit_count
+    FROM properties p
+    LEFT JOIN units u ON p.id = u.property_id
+    GROUP BY p.id
+    ORDER BY p.name
+"""
+
+# Result columns of _SQL_ALL_TENANTS and _SQL_ALL_PROPERTIES, in SELECT order,
+# so DataFrames can be built without inferring the schema from each row
+TENANT_COLUMNS = ('id', 'first_name', 'last_name', 'email', 'phone',
+                  'date_of_birth', 'created_at')
+PROPERTY_COLUMNS = ('id', 'name', 'address_line1', 'address_line2', 'city',
+                    'state', 'postal_code', 'country', 'created_at', 'unit_count')
+
+# Tables whose raw rows may be browsed; names are interpolated into SQL, so
+# only these are accepted
+BROWSABLE_TABLES = ('tenants', 'properties', 'units', 'leases',
+                    'payments', 'service_tickets', 'agents')
+
+# Authorizer actions an ad-hoc query may perform: reading rows, calling
+# functions and recursive CTEs. Anything else is denied at compile time.
+_READ_ONLY_ACTIONS = frozenset({sqlite3.SQLITE_SELECT, sqlite3.SQLITE_READ,
+                                sqlite3.SQLITE_FUNCTION, sqlite3.SQLITE_RECURSIVE})
+
+# Units with the tenant of their active lease, if any
+_SQL_UNITS_WITH_TENANT = """
+    SELECT u.*,
+           CASE WHEN t.id IS NOT NULL THEN 'occupied' ELSE u.status END as current_status,
+           t.first_name as tenant_first_name,
+           t.last_name as tenant_last_name
+    FROM units u
+    LEFT JOIN tenants t ON t.id = (
+        SELECT l.tenant_id FROM leases l
+        WHERE l.unit_id = u.id AND l.status = 'active'
+        LIMIT 1
+    )
+"""
+
+_SQL_UNITS_BY_PROPERTY = _SQL_UNITS_WITH_TENANT + """
+    WHERE u.property_id = ?
+    ORDER BY u.unit_number
+"""
+
+# Property ids arrive as one JSON array parameter, unpacked by json_each
+_SQL_UNITS_FOR_PROPERTIES = _SQL_UNITS_WITH_TENANT + """
+    WHERE u.property_id IN (SELECT value FROM json_each(?))
+    ORDER BY u.property_id, u.unit_number
+"""
+
+# A unit counts as occupied when it has an active lease or is marked occupied,
+# matching current_status in _SQL_UNITS_WITH_TENANT
+_SQL_UNIT_COUNTS_BY_PROPERTY = """
+    SELECT property_id,
+           COUNT(*) as total,
+           SUM(occupied) as occupied,
+           COUNT(*) - SUM(occupied) as vacant
+    FROM (
+        SELECT u.property_id,
+               (u.status = 'occupied' OR EXISTS (
+                   SELECT 1 FROM leases l
+                   WHERE l.unit_id = u.id AND l.status = 'active'
+               )) as occupied
+        FROM units u
+    )
+    GROUP BY property_id
+"""
+
+# Portfolio-wide unit totals, with occupied defined as above
+_SQL_PORTFOLIO_OCCUPANCY = """
+    SELECT COUNT(*) as total,
+           COALESCE(SUM(u.status = 'occupied' OR EXISTS (
+               SELECT 1 FROM leases l
+               WHERE l.unit_id = u.id AND l.status = 'active'
+           )), 0) as occupied
+    FROM units u
+"""
+
+_SQL_ACTIVE_LEASES = """
+    SELECT *
+    FROM lease_full
+    WHERE status = 'active'
+    ORDER BY end_date
+"""
+
+_SQL_EXPIRING_LEASES = """
+    SELECT *
+    FROM lease_full
+    WHERE status = 'active'
+      AND end_date <= date('now', printf('%+d hours', ?), printf('%+d days', ?))
+    ORDER BY end_date
+"""
+
+# Active lease count plus the count and rent of those ending within the
+# next N days in local time, matching _SQL_EXPIRING_LEASES
+_SQL_LEASE_RISK_SUMMARY = """
+    SELECT COUNT(*) as active_count,
+           COUNT(CASE WHEN l.end_date <= d.horizon THEN 1 END) as expiring_count,
+           COALESCE(SUM(CASE WHEN l.end_date <= d.horizon THEN l.rent_amount END), 0) as rent_at_risk
+    FROM leases l,
+         (SELECT date('now', printf('%+d hours', ?), printf('%+d days', ?)) as horizon) d
+    WHERE l.status = 'active'
+"""
+
+_SQL_PENDING_PAYMENTS = """
+    SELECT p.*,
+           lf.tenant_first_name,
+           lf.tenant_last_name,
+           lf.tenant_email,
+           lf.property_name,
+           lf.unit_number
+    FROM payments p
+    JOIN lease_full lf ON p.lease_id = lf.id
+    WHERE p.paid_on IS NULL
+    ORDER BY p.due_date
+"""
+
+# Totals over unpaid payments; overdue means due before today in local time
+_SQL_PENDING_PAYMENTS_SUMMARY = """
+    SELECT COALESCE(SUM(p.amount), 0) as total,
+           COUNT(*) as count,
+           COALESCE(SUM(CASE WHEN p.due_date < d.today THEN p.amount END), 0) as overdue_total,
+           COUNT(CASE WHEN p.due_date < d.today THEN 1 END) as overdue_count
+    FROM payments p,
+         (SELECT date('now', printf('%+d hours', ?)) as today) d
+    WHERE p.paid_on IS NULL
+"""
+
+_SQL_MARK_PAYMENT_PAID = """
+    UPDATE payments
+    SET paid_on = strftime('%Y-%m-%d %H:%M:%S', 'now', printf('%+d hours', ?)),
+        method = ?,
+        reference_number = ?
+    WHERE id = ?
+"""
+
+_SQL_OPEN_TICKETS = """
+    SELECT st.*,
+           lf.tenant_first_name,
+           lf.tenant_last_name,
+           a.first_name as agent_first_name,
+           a.last_name as agent_last_name,
+           lf.property_name,
+           lf.unit_number
+    FROM service_tickets st
+    JOIN lease_full lf ON st.lease_id = lf.id
+    LEFT JOIN agents a ON st.assigned_to = a.id
+    WHERE st.status IN ('open', 'in_progress')
+    ORDER BY st.priority DESC, st.created_at
+"""
+
+_SQL_OPEN_TICKET_PRIORITY_COUNTS = """
+    SELECT priority, COUNT(*) as count
+    FROM service_tickets
+    WHERE status IN ('open', 'in_progress')
+    GROUP BY priority
+"""
+
+_SQL_TOP_OPEN_TICKET_CATEGORIES = """
+    SELECT COALESCE(category, 'Unknown') as category, COUNT(*) as count
+    FROM service_tickets
+    WHERE status IN ('open', 'in_progress')
+    GROUP BY 1
+    ORDER BY count DESC, category
+    LIMIT ?
+"""
 
-        conn.commit()
-        conn.close()
+_SQL_CREATE_TICKET = """
+    INSERT INTO service_tickets (lease_id, raised_by, category, subcategory, description, priority)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_ASSIGN_TICKET = """
+    UPDATE service_tickets
+    SET assigned_to = ?,
+        status = 'assigned',
+        updated_at = unixepoch()
+    WHERE id = ?
+"""
+
+# collection_rate is the collected share of the month's amount due, as a
+# percentage; NULL when nothing is due
+_SQL_FINANCIAL_SUMMARY = """
+    SELECT
+        COALESCE(SUM(CASE WHEN p.paid_on IS NOT NULL THEN p.amount ELSE 0 END), 0) as total_collected,
+        COALESCE(SUM(CASE WHEN p.paid_on IS NULL THEN p.amount ELSE 0 END), 0) as total_pending,
+        COUNT(CASE WHEN p.paid_on IS NOT NULL THEN 1 END) as payments_received,
+        COUNT(CASE WHEN p.paid_on IS NULL THEN 1 END) as payments_pending,
+        100.0 * SUM(CASE WHEN p.paid_on IS NOT NULL THEN p.amount ELSE 0 END)
+              / NULLIF(SUM(p.amount), 0) as collection_rate
+    FROM payments p
+    WHERE strftime('%Y-%m', p.due_date) = COALESCE(?, strftime('%Y-%m', 'now'))
+"""
+
+def full_name(row: Dict, prefix: str = 'tenant') -> Optional[str]:
+    """Join a row's <prefix>_first_name and <prefix>_last_name for display"""
+    first = row.get(f'{prefix}_first_name')
+    last = row.get(f'{prefix}_last_name')
+    if first is None or last is None:
+        return None
+    return f"{first} {last}"
+
+class DictCursor(sqlite3.Cursor):
+    """Cursor whose rows are plain dicts, ready for callers and DataFrames"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._description = None
+        self._columns = ()
+        self.row_factory = self._make_row
+
+    def _make_row(self, cursor, row):
+        # description is one object per executed statement, so the column
+        # names are extracted once per query rather than once per row
+        description = self.description
+        if description is not self._description:
+            self._description = description
+            self._columns = tuple(column[0] for column in description)
+        return dict(zip(self._columns, row))
+
+class DatabaseManager:
+    """Handles all database operations"""
+
+    # Database files already switched to WAL; the mode persists in the file
+    _wal_paths = set()
+
+    def __init__(self, db_path: str = 'database.db'):
+        self.db_path = db_path
+        self._local = threading.local()  # One connection per thread
+        # Connection handed to each thread, so connections left behind by
+        # finished threads (Streamlit runs every rerun on a new one) are
+        # reused or closed instead of waiting for garbage collection
+        self._owners = {}
+        self._owners_lock = threading.Lock()
+        self.init_database()
+
+    def get_connection(self):
+        """Get this thread's database connection, on first use taking over
+        one from a finished thread or opening a new one"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._reclaim_connection()
+            if conn is None:
+                conn = Config.connect(self.db_path)
+                if self.db_path != ':memory:' and self.db_path not in self._wal_paths:
+                    conn.execute("PRAGMA journal_mode=WAL;")
+                    self._wal_paths.add(self.db_path)
+                conn.execute("PRAGMA foreign_keys = ON;")
+            with self._owners_lock:
+                self._owners[threading.current_thread()] = conn
+            self._local.conn = conn
+        return conn
+
+    def _reclaim_connection(self):
+        """Release the connections of finished threads, returning one for reuse"""
+        with self._owners_lock:
+            finished = [thread for thread in self._owners if not thread.is_alive()]
+            released = [self._owners.pop(thread) for thread in finished]
+        if not released:
+            return None
+        reused, extra = released[0], released[1:]
+        for conn in extra:
+            Config.close_connection(conn)
+        if reused.in_transaction:
+            reused.rollback()
+        return reused
+
+    def close(self):
+        """Refresh planner statistics and close this thread's connection, if open"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            with self._owners_lock:
+                self._owners.pop(threading.current_thread(), None)
+            Config.close_connection(conn)
+            self._local.conn = None
+
+    def init_database(self):
+        """Create the schema unless it is already current, then seed sample data"""
+        conn = self.get_connection()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != Config.SCHEMA_VERSION:
+            self.rebuild_database()
+        else:
+            apply_objects(conn)
+            self.seed_if_empty()
         print("Database initialized successfully!")
 
+    def rebuild_database(self):
+        """Recreate the schema and load sample data in a single transaction"""
+        conn = self.get_connection()
+        # The rebuild is all-or-nothing, so skip per-commit syncing while
+        # it runs and restore the configured level afterwards
+        conn.execute("PRAGMA synchronous=OFF")
+        try:
+            with Config.bulk_load(conn):
+                create_schema(conn)
+                self._insert_sample_data(conn)
+        finally:
+            conn.execute(f"PRAGMA synchronous={Config.SQLITE_PRAGMAS['synchronous']}")
+        conn.execute("ANALYZE")
+
+    def seed_if_empty(self):
+        """Insert sample data when the tenants table has no rows"""
+        conn = self.get_connection()
+        if conn.execute("SELECT EXISTS (SELECT 1 FROM tenants)").fetchone()[0]:
+            return
+
+        with Config.bulk_load(conn):
+            self._insert_sample_data(conn)
+        # Give the planner statistics for the freshly loaded tables
+        conn.execute("ANALYZE")
+
+    @staticmethod
+    def _insert_sample_data(conn):
+        """Insert SAMPLE_DATA inside the caller's open transaction"""
+        # One INSERT ... SELECT per table: the rows travel as a single JSON
+        # array parameter and SQLite unpacks them with json_each
+        for table, columns, rows in SAMPLE_DATA:
+            values = ', '.join(f"value ->> {i}" for i in range(len(columns)))
+            conn.execute(
+                f"INSERT INTO {table} ({', '.join(columns)}) SELECT {values} FROM json_each(?)",
+                (json.dumps(rows),)
+            )
+
 class PropertyManager:
     """Main business logic for property management"""
 
     def __init__(self):
         self.db = DatabaseManager()
+        self._read_pool = None  # Worker threads for concurrent dashboard reads
 
     # TENANT OPERATIONS
     def get_all_tenants(self) -> List[Dict]:
         """Get all tenants"""
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(DictCursor)
+            cursor.execute(_SQL_ALL_TENANTS)
+            return cursor.fetchall()
+
+    def get_all_tenants_df(self):
+        """Get all tenants as a pandas DataFrame, read straight from the cursor"""
+        import pandas as pd
+        with self.db.get_connection() as conn:
+            return pd.read_sql_query(_SQL_ALL_TENANTS, conn)
+
+    def get_table_preview(self, table_name: str, limit: int = 100):
+        """Get the first rows of a browsable table as an Arrow-backed DataFrame"""
+        if table_name not in BROWSABLE_TABLES:
+            raise ValueError(f"Unknown table: {table_name}")
+        import pandas as pd
+        with self.db.get_connection() as conn:
+            return pd.read_sql_query(f"SELECT * FROM {table_name} LIMIT ?", conn,
+                                     params=(limit,), dtype_backend='pyarrow')
+
+    def run_select_query(self, query: str):
+        """Run an ad-hoc read-only query and return its rows as a DataFrame
+
+        SQLite's authorizer vets the statement while it is compiled, so
+        writes, DDL, PRAGMA and ATTACH are refused before anything runs.
+        """
+        import pandas as pd
+        denied = []
+
+        def authorize(action, *args):
+            if action in _READ_ONLY_ACTIONS:
+                return sqlite3.SQLITE_OK
+            denied.append(action)
+            return sqlite3.SQLITE_DENY
+
         conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM tenants ORDER BY last_name, first_name")
-        tenants = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return tenants
+        conn.set_authorizer(authorize)
+        try:
+            return pd.read_sql_query(query, conn)
+        except Exception:
+            if denied:
+                raise ValueError("Only SELECT queries are allowed") from None
+            raise
+        finally:
+            conn.set_authorizer(None)
+
+    def iter_all_tenants(self) -> Iterator[Dict]:
+        """Yield tenants one at a time without building the full list"""
+        cursor = self.db.get_connection().cursor(DictCursor)
+        yield from cursor.execute(_SQL_ALL_TENANTS)
 
     def get_tenant_by_id(self, tenant_id: int) -> Optional[Dict]:
         """Get tenant by ID"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM tenants WHERE id = ?", (tenant_id,))
-        row = cursor.fetchone()
-        conn.close()
-        return dict(row) if row else None
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(DictCursor)
+            cursor.execute(_SQL_TENANT_BY_ID, (tenant_id,))
+            return cursor.fetchone()
 
     def add_tenant(self, first_name: str, last_name: str, email: str,
                    phone: str = None, date_of_birth: str = None) -> int:
         """Add new tenant"""
+        with self.db.get_connection() as conn:
+            return conn.execute(_SQL_ADD_TENANT,
+                                (first_name, last_name, email, phone, date_of_birth)).lastrowid
+
+    def add_tenants(self, rows, batch_size: int = 5000) -> int:
+        """Add many tenants from (first_name, last_name, email, phone, date_of_birth) tuples"""
+        rows = list(rows)
         conn = self.db.get_connection()
         cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO tenants (first_name, last_name, email, phone, date_of_birth)
-            VALUES (?, ?, ?, ?, ?)
-        """, (first_name, last_name, email, phone, date_of_birth))
-        tenant_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        return tenant_id
+        # One transaction per batch keeps the WAL bounded on large imports
+        for start in range(0, len(rows), batch_size):
+            with Config.bulk_load(conn):
+                cursor.executemany(_SQL_ADD_TENANT, rows[start:start + batch_size])
+        return len(rows)
 
     # PROPERTY OPERATIONS
     def get_all_properties(self) -> List[Dict]:
         """Get all properties with unit counts"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT p.*, COUNT(u.id) as unit_count
-            FROM properties p
-            LEFT JOIN units u ON p.id = u.property_id
-            GROUP BY p.id
-            ORDER BY p.name
-        """)
-        properties = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return properties
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(DictCursor)
+            cursor.execute(_SQL_ALL_PROPERTIES)
+            return cursor.fetchall()
 
     def get_units_by_property(self, property_id: int) -> List[Dict]:
         """Get all units for a property"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT u.*,
-                   CASE WHEN l.id IS NOT NULL THEN 'occupied' ELSE u.status END as current_status,
-                   t.first_name || ' ' || t.last_name as tenant_name
-            FROM units u
-            LEFT JOIN leases l ON u.id = l.unit_id AND l.status = 'active'
-            LEFT JOIN tenants t ON l.tenant_id = t.id
-            WHERE u.property_id = ?
-            ORDER BY u.unit_number
-        """, (property_id,))
-        units = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return units
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(DictCursor)
+            cursor.execute(_SQL_UNITS_BY_PROPERTY, (property_id,))
+            return cursor.fetchall()
+
+    def get_units_for_properties(self, property_ids) -> Dict[int, List[Dict]]:
+        """Get units for several properties in one query, keyed by property id"""
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(DictCursor)
+            cursor.execute(_SQL_UNITS_FOR_PROPERTIES, (json.dumps(list(property_ids)),))
+            return {property_id: list(units)
+                    for property_id, units in groupby(cursor, key=itemgetter('property_id'))}
+
+    def get_unit_counts_by_property(self) -> Dict[int, Dict]:
+        """Get total, occupied and vacant unit counts keyed by property id"""
+        with self.db.get_connection() as conn:
+            return self._unit_counts(conn.cursor(DictCursor))
+
+    @staticmethod
+    def _unit_counts(cursor) -> Dict[int, Dict]:
+        """Run the grouped unit count query and index the rows by property id"""
+        return {row['property_id']: row
+                for row in cursor.execute(_SQL_UNIT_COUNTS_BY_PROPERTY)}
+
+    def get_portfolio_occupancy(self) -> Dict:
+        """Get total and occupied unit counts across every property"""
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(DictCursor)
+            cursor.execute(_SQL_PORTFOLIO_OCCUPANCY)
+            return cursor.fetchone()
 
     # LEASE OPERATIONS
     def get_active_leases(self) -> List[Dict]:
         """Get all active leases with tenant and unit info"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT l.*,
-                   t.first_name || ' ' || t.last_name as tenant_name,
-                   t.email as tenant_email,
-                   p.name as property_name,
-                   u.unit_number
-            FROM leases l
-            JOIN tenants t ON l.tenant_id = t.id
-            JOIN units u ON l.unit_id = u.id
-            JOIN properties p ON u.property_id = p.id
-            WHERE l.status = 'active'
-            ORDER BY l.end_date
-        """)
-        leases = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return leases
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(DictCursor)
+            cursor.execute(_SQL_ACTIVE_LEASES)
+            return cursor.fetchall()
+
+    def iter_active_leases(self) -> Iterator[Dict]:
+        """Yield active leases one at a time without building the full list"""
+        cursor = self.db.get_connection().cursor(DictCursor)
+        yield from cursor.execute(_SQL_ACTIVE_LEASES)
 
     def get_expiring_leases(self, days_ahead: int = 30) -> List[Dict]:
         """Get leases expiring within specified days"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        end_date = datetime.now() + timedelta(days=days_ahead)
-        cursor.execute("""
-            SELECT l.*,
-                   t.first_name || ' ' || t.last_name as tenant_name,
-                   t.email as tenant_email,
-                   p.name as property_name,
-                   u.unit_number
-            FROM leases l
-            JOIN tenants t ON l.tenant_id = t.id
-            JOIN units u ON l.unit_id = u.id
-            JOIN properties p ON u.property_id = p.id
-            WHERE l.status = 'active' AND l.end_date <= ?
-            ORDER BY l.end_date
-        """, (end_date.strftime('%Y-%m-%d'),))
-        leases = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return leases
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(DictCursor)
+            cursor.execute(_SQL_EXPIRING_LEASES, (Config.TIMEZONE_OFFSET_HOURS, days_ahead))
+            return cursor.fetchall()
+
+    def get_lease_risk_summary(self, days_ahead: int = 30) -> Dict:
+        """Get active lease count and the count and rent of those expiring within specified days"""
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(DictCursor)
+            cursor.execute(_SQL_LEASE_RISK_SUMMARY, (Config.TIMEZONE_OFFSET_HOURS, days_ahead))
+            return cursor.fetchone()
 
     # PAYMENT OPERATIONS
     def get_pending_payments(self) -> List[Dict]:
         """Get all pending payments"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT p.*,
-                   t.first_name || ' ' || t.last_name as tenant_name,
-                   t.email as tenant_email,
-                   pr.name as property_name,
-                   u.unit_number
-            FROM payments p
-            JOIN leases l ON p.lease_id = l.id
-            JOIN tenants t ON l.tenant_id = t.id
-            JOIN units u ON l.unit_id = u.id
-            JOIN properties pr ON u.property_id = pr.id
-            WHERE p.paid_on IS NULL
-            ORDER BY p.due_date
-        """)
-        payments = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return payments
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(DictCursor)
+            cursor.execute(_SQL_PENDING_PAYMENTS)
+            return cursor.fetchall()
+
+    def get_pending_payments_df(self):
+        """Get all pending payments as a DataFrame with due_date parsed"""
+        import pandas as pd
+        with self.db.get_connection() as conn:
+            return pd.read_sql_query(_SQL_PENDING_PAYMENTS, conn,
+                                     parse_dates={'due_date': Config.DATE_FORMAT})
+
+    def get_pending_payments_summary(self) -> Dict:
+        """Get total, overdue total and overdue count of pending payments"""
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(DictCursor)
+            cursor.execute(_SQL_PENDING_PAYMENTS_SUMMARY, (Config.TIMEZONE_OFFSET_HOURS,))
+            return cursor.fetchone()
+
+    def iter_pending_payments(self) -> Iterator[Dict]:
+        """Yield pending payments one at a time without building the full list"""
+        cursor = self.db.get_connection().cursor(DictCursor)
+        yield from cursor.execute(_SQL_PENDING_PAYMENTS)
 
     def mark_payment_paid(self, payment_id: int, method: str, reference: str = None):
         """Mark a payment as paid"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE payments
-            SET paid_on = strftime('%Y-%m-%d %H:%M:%S','now','+8 hours'),
-                method = ?,
-                reference_number = ?
-            WHERE id = ?
-        """, (method, reference, payment_id))
-        conn.commit()
-        conn.close()
+        with self.db.get_connection() as conn:
+            conn.execute(_SQL_MARK_PAYMENT_PAID,
+                         (Config.TIMEZONE_OFFSET_HOURS, method, reference, payment_id))
 
     # SERVICE TICKET OPERATIONS
     def get_open_tickets(self) -> List[Dict]:
         """Get all open service tickets"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT st.*,
-                   t.first_name || ' ' || t.last_name as tenant_name,
-                   a.first_name || ' ' || a.last_name as agent_name,
-                   p.name as property_name,
-                   u.unit_number
-            FROM service_tickets st
-            JOIN leases l ON st.lease_id = l.id
-            JOIN tenants t ON l.tenant_id = t.id
-            JOIN units u ON l.unit_id = u.id
-            JOIN properties p ON u.property_id = p.id
-            LEFT JOIN agents a ON st.assigned_to = a.id
-            WHERE st.status IN ('open', 'in_progress')
-            ORDER BY st.priority DESC, st.created_at
-        """)
-        tickets = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return tickets
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(DictCursor)
+            cursor.execute(_SQL_OPEN_TICKETS)
+            return cursor.fetchall()
+
+    def get_open_ticket_priority_counts(self) -> Dict[str, int]:
+        """Get the number of open service tickets for each priority"""
+        with self.db.get_connection() as conn:
+            return dict(conn.execute(_SQL_OPEN_TICKET_PRIORITY_COUNTS).fetchall())
+
+    def get_top_open_ticket_categories(self, limit: int = 1) -> List[Tuple[str, int]]:
+        """Get the most common categories among open service tickets with their counts"""
+        with self.db.get_connection() as conn:
+            return conn.execute(_SQL_TOP_OPEN_TICKET_CATEGORIES, (limit,)).fetchall()
+
+    def iter_open_tickets(self) -> Iterator[Dict]:
+        """Yield open service tickets one at a time without building the full list"""
+        cursor = self.db.get_connection().cursor(DictCursor)
+        yield from cursor.execute(_SQL_OPEN_TICKETS)
 
     def create_service_ticket(self, lease_id: int, raised_by: int, category: str,
                              description: str, priority: str = 'normal',
                              subcategory: str = None) -> int:
         """Create new service ticket"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO service_tickets (lease_id, raised_by, category, subcategory, description, priority)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (lease_id, raised_by, category, subcategory, description, priority))
-        ticket_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        return ticket_id
+        with self.db.get_connection() as conn:
+            return conn.execute(_SQL_CREATE_TICKET,
+                                (lease_id, raised_by, category, subcategory, description, priority)).lastrowid
 
     def assign_ticket(self, ticket_id: int, agent_id: int):
         """Assign ticket to agent"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE service_tickets
-            SET assigned_to = ?,
-                status = 'assigned',
-                updated_at = strftime('%Y-%m-%d %H:%M:%S','now','+8 hours')
-            WHERE id = ?
-        """, (agent_id, ticket_id))
-        conn.commit()
-        conn.close()
+        with self.db.get_connection() as conn:
+            conn.execute(_SQL_ASSIGN_TICKET, (agent_id, ticket_id))
 
     # REPORTING
     def get_financial_summary(self, month: str = None) -> Dict:
         """Get financial summary for a given month (YYYY-MM format)"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-
-        if month:
-            date_filter = f"AND strftime('%Y-%m', p.due_date) = '{month}'"
-        else:
-            date_filter = f"AND strftime('%Y-%m', p.due_date) = strftime('%Y-%m', 'now')"
-
-        cursor.execute(f"""
-            SELECT
-                COALESCE(SUM(CASE WHEN p.paid_on IS NOT NULL THEN p.amount ELSE 0 END), 0) as total_collected,
-                COALESCE(SUM(CASE WHEN p.paid_on IS NULL THEN p.amount ELSE 0 END), 0) as total_pending,
-                COUNT(CASE WHEN p.paid_on IS NOT NULL THEN 1 END) as payments_received,
-                COUNT(CASE WHEN p.paid_on IS NULL THEN 1 END) as payments_pending
-            FROM payments p
-            WHERE 1=1 {date_filter}
-        """)
-
-        summary = dict(cursor.fetchone())
-        conn.close()
-        return summary
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(DictCursor)
+            cursor.execute(_SQL_FINANCIAL_SUMMARY, (month,))
+            return cursor.fetchone()
+
+
+    def dashboard(self, month: str = None, concurrent: bool = False) -> Dict:
+        """Fetch everything the dashboard shows
+
+        By default every query runs in one read transaction, so all of them
+        see the same snapshot. With concurrent=True the queries run side by
+        side on a thread pool, each worker reading through its own
+        thread-local connection; results may then come from snapshots a
+        few milliseconds apart.
+        """
+        queries = self._dashboard_queries(month)
+        if concurrent and self.db.db_path != ':memory:':
+            if self._read_pool is None:
+                self._read_pool = ThreadPoolExecutor(max_workers=len(queries),
+                                                     thread_name_prefix='dashboard-read')
+            futures = {name: self._read_pool.submit(self._run_read, fetch)
+                       for name, fetch in queries.items()}
+            return {name: future.result() for name, future in futures.items()}
 
+        conn = self.db.get_connection()
+        cursor = conn.cursor(DictCursor)
+        # One read transaction: every query sees the same WAL snapshot and
+        # shares the connection's warm page cache
+        conn.execute("BEGIN")
+        try:
+            return {name: fetch(cursor) for name, fetch in queries.items()}
+        finally:
+            conn.execute("COMMIT")
+
+    def _dashboard_queries(self, month: str = None) -> Dict:
+        """Dashboard result names mapped to functions that fetch them from a cursor"""
+        offset = (Config.TIMEZONE_OFFSET_HOURS,)
+        return {
+            'tenants': lambda cursor: cursor.execute(_SQL_ALL_TENANTS).fetchall(),
+            'properties': lambda cursor: cursor.execute(_SQL_ALL_PROPERTIES).fetchall(),
+            'unit_counts': self._unit_counts,
+            'active_leases': lambda cursor: cursor.execute(_SQL_ACTIVE_LEASES).fetchall(),
+            'pending_summary': lambda cursor: cursor.execute(_SQL_PENDING_PAYMENTS_SUMMARY, offset).fetchone(),
+            'open_tickets': lambda cursor: cursor.execute(_SQL_OPEN_TICKETS).fetchall(),
+            'ticket_priority_counts': lambda cursor: {
+                row['priority']: row['count']
+                for row in cursor.execute(_SQL_OPEN_TICKET_PRIORITY_COUNTS)
+            },
+            'financial_summary': lambda cursor: cursor.execute(_SQL_FINANCIAL_SUMMARY, (month,)).fetchone(),
+        }
+
+    def _run_read(self, fetch):
+        """Run one fetch on the calling thread's own connection"""
+        return fetch(self.db.get_connection().cursor(DictCursor))
 
 def main():
     """Main entry point"""
@@ -2,12 +2,78 @@
 Data models and utility classes for Property Management System
 """
 
+import json
+import random
+import re
+import sys
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from dataclasses import dataclass, fields
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
-import json
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional; exports fall back to the json module
+    orjson = None
+
+from config import ACTIVE_CONFIG as Config
+
+# Validation patterns, compiled once at import
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Malaysian mobile numbers: 01X-XXXXXXX, 01XXXXXXXX, +601X-XXXXXXX and
+# +601XXXXXXXX (7 or 8 digits after the prefix)
+_PHONE_RE = re.compile(r'^(?:\+6)?01[0-9]-?[0-9]{7,8}$')
+# Malaysian postal codes are 5 digits
+_POSTAL_MY_RE = re.compile(r'^\d{5}$')
+# Characters not allowed in file names
+_FILENAME_UNSAFE_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Tenant age buckets: an age up to and including _AGE_EDGES[i] falls in
+# _AGE_LABELS[i], anything above the last edge in the final label
+_AGE_EDGES = (25, 35, 45, 55)
+_AGE_LABELS = ('18-25', '26-35', '36-45', '46-55', '55+')
+
+# Tenant contact completeness bucket by (has_email, has_phone)
+_CONTACT_COMPLETENESS = {
+    (True, True): 'both',
+    (True, False): 'email_only',
+    (False, True): 'phone_only',
+    (False, False): 'neither'
+}
+
+def _intern(value):
+    """Intern enum-like strings (statuses, types) so equal values share one object"""
+    return sys.intern(value) if type(value) is str else value
+
+def _pandas():
+    """The pandas module, imported on first use, or None if it is not installed"""
+    try:
+        import pandas
+    except ImportError:
+        return None
+    return pandas
+
+@lru_cache(maxsize=4096)
+def _age_on(birth_date: str, today: date) -> Optional[int]:
+    """Age in whole years on a given day; cached per (birth_date, today)"""
+    try:
+        birth = date.fromisoformat(birth_date)
+        return today.year - birth.year - ((today.month, today.day) < (birth.month, birth.day))
+    except ValueError:
+        return None
+
+def _days_until(date_str: Optional[str], today: date) -> Optional[int]:
+    """Days from today until an ISO date string, or None if missing or malformed"""
+    if not date_str:
+        return None
+    try:
+        return (date.fromisoformat(date_str) - today).days
+    except ValueError:
+        return None
+
+@dataclass(slots=True)
 class Tenant:
     """Tenant data model"""
     id: Optional[int] = None
@@ -16,21 +82,28 @@ class Tenant:
     email: str = ""
     phone: Optional[str] = None
     date_of_birth: Optional[str] = None
-    created_at: Optional[str] = None
-    timestamp: Optional[str] = None
+    created_at: Optional[int] = None
 
     @property
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}".strip()
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'id': self.id,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'email': self.email,
+            'phone': self.phone,
+            'date_of_birth': self.date_of_birth,
+            'created_at': self.created_at
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Tenant':
-        return cls(**data)
+        return cls(*[data.get(name, default) for name, default in cls._FIELDS])
 
-@dataclass
+@dataclass(slots=True)
 class Property:
     """Property data model"""
     id: Optional[int] = None
@@ -41,25 +114,31 @@ class Property:
     state: Optional[str] = None
     postal_code: Optional[str] = None
     country: str = ""
-    created_at: Optional[str] = None
-    timestamp: Optional[str] = None
+    created_at: Optional[int] = None
 
     @property
     def full_address(self) -> str:
-        parts = [self.address_line1]
-        if self.address_line2:
-            parts.append(self.address_line2)
-        parts.extend([self.city, self.state, self.postal_code])
-        return ", ".join(filter(None, parts))
+        return ", ".join(part for part in (self.address_line1, self.address_line2, self.city,
+                                           self.state, self.postal_code) if part)
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'id': self.id,
+            'name': self.name,
+            'address_line1': self.address_line1,
+            'address_line2': self.address_line2,
+            'city': self.city,
+            'state': self.state,
+            'postal_code': self.postal_code,
+            'country': self.country,
+            'created_at': self.created_at
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Property':
-        return cls(**data)
+        return cls(*[data.get(name, default) for name, default in cls._FIELDS])
 
-@dataclass
+@dataclass(slots=True)
 class Unit:
     """Unit data model"""
     id: Optional[int] = None
@@ -70,40 +149,49 @@ class Unit:
     bathrooms: Optional[float] = None
     square_feet: Optional[int] = None
     status: str = "available"
-    created_at: Optional[str] = None
-    timestamp: Optional[str] = None
+    created_at: Optional[int] = None
+
+    def __post_init__(self):
+        self.status = _intern(self.status)
 
     @property
     def description(self) -> str:
-        parts = []
-        if self.bedrooms:
-            parts.append(f"{self.bedrooms}BR")
-        if self.bathrooms:
-            parts.append(f"{self.bathrooms}BA")
-        if self.square_feet:
-            parts.append(f"{self.square_feet}sqft")
-        return " / ".join(parts)
+        specs = ((self.bedrooms, "BR"), (self.bathrooms, "BA"), (self.square_feet, "sqft"))
+        return " / ".join(f"{value}{suffix}" for value, suffix in specs if value)
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'id': self.id,
+            'property_id': self.property_id,
+            'unit_number': self.unit_number,
+            'floor': self.floor,
+            'bedrooms': self.bedrooms,
+            'bathrooms': self.bathrooms,
+            'square_feet': self.square_feet,
+            'status': self.status,
+            'created_at': self.created_at
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Unit':
-        return cls(**data)
+        return cls(*[data.get(name, default) for name, default in cls._FIELDS])
 
-@dataclass
+@dataclass(slots=True)
 class Lease:
     """Lease data model"""
     id: Optional[int] = None
+    # Read by the expiry and rent reports
+    status: str = "active"
+    rent_amount: float = 0.0
+    end_date: str = ""
     tenant_id: int = 0
     unit_id: int = 0
     start_date: str = ""
-    end_date: str = ""
-    rent_amount: float = 0.0
     security_deposit: Optional[float] = None
-    status: str = "active"
-    created_at: Optional[str] = None
-    timestamp: Optional[str] = None
+    created_at: Optional[int] = None
+
+    def __post_init__(self):
+        self.status = _intern(self.status)
 
     @property
     def is_active(self) -> bool:
@@ -111,28 +199,30 @@ class Lease:
 
     @property
     def days_until_expiry(self) -> Optional[int]:
-        if not self.end_date:
-            return None
-        try:
-            end_date = datetime.strptime(self.end_date, '%Y-%m-%d').date()
-            today = date.today()
-            return (end_date - today).days
-        except ValueError:
-            return None
+        return _days_until(self.end_date, date.today())
 
-    @property
-    def is_expiring_soon(self, days: int = 30) -> bool:
-        days_left = self.days_until_expiry
+    def is_expiring_soon(self, days: int = 30, today: Optional[date] = None) -> bool:
+        days_left = _days_until(self.end_date, today or date.today())
         return days_left is not None and 0 <= days_left <= days
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'id': self.id,
+            'tenant_id': self.tenant_id,
+            'unit_id': self.unit_id,
+            'start_date': self.start_date,
+            'end_date': self.end_date,
+            'rent_amount': self.rent_amount,
+            'security_deposit': self.security_deposit,
+            'status': self.status,
+            'created_at': self.created_at
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Lease':
-        return cls(**data)
+        return cls(*[data.get(name, default) for name, default in cls._FIELDS])
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """Agent data model"""
     id: Optional[int] = None
@@ -141,8 +231,10 @@ class Agent:
     role: Optional[str] = None
     email: Optional[str] = None
     phone: Optional[str] = None
-    created_at: Optional[str] = None
-    timestamp: Optional[str] = None
+    created_at: Optional[int] = None
+
+    def __post_init__(self):
+        self.role = _intern(self.role)
 
     @property
     def full_name(self) -> str:
@@ -155,27 +247,39 @@ class Agent:
         return "Unknown Agent"
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'id': self.id,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'role': self.role,
+            'email': self.email,
+            'phone': self.phone,
+            'created_at': self.created_at
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Agent':
-        return cls(**data)
+        return cls(*[data.get(name, default) for name, default in cls._FIELDS])
 
-@dataclass
+@dataclass(slots=True)
 class ServiceTicket:
     """Service ticket data model"""
     id: Optional[int] = None
+    # Checked by is_open and priority_level
+    status: str = "open"
+    priority: str = "normal"
     lease_id: int = 0
     raised_by: int = 0
     assigned_to: Optional[int] = None
     category: str = ""
     subcategory: Optional[str] = None
     description: str = ""
-    status: str = "open"
-    priority: str = "normal"
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
-    timestamp: Optional[str] = None
+    created_at: Optional[int] = None
+    updated_at: Optional[int] = None
+
+    def __post_init__(self):
+        self.status = _intern(self.status)
+        self.priority = _intern(self.priority)
 
     @property
     def is_open(self) -> bool:
@@ -187,26 +291,42 @@ class ServiceTicket:
         return priority_map.get(self.priority, 2)
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'id': self.id,
+            'lease_id': self.lease_id,
+            'raised_by': self.raised_by,
+            'assigned_to': self.assigned_to,
+            'category': self.category,
+            'subcategory': self.subcategory,
+            'description': self.description,
+            'status': self.status,
+            'priority': self.priority,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'ServiceTicket':
-        return cls(**data)
+        return cls(*[data.get(name, default) for name, default in cls._FIELDS])
 
-@dataclass
+@dataclass(slots=True)
 class Payment:
     """Payment data model"""
     id: Optional[int] = None
+    # Needed for paid/overdue status and totals
+    amount: float = 0.0
+    paid_on: Optional[str] = None
+    due_date: Optional[str] = None
     lease_id: int = 0
     payment_type: str = ""
     billing_period: Optional[str] = None
-    due_date: Optional[str] = None
-    amount: float = 0.0
     method: Optional[str] = None
-    paid_on: Optional[str] = None
     reference_number: Optional[str] = None
-    created_at: Optional[str] = None
-    timestamp: Optional[str] = None
+    created_at: Optional[int] = None
+
+    def __post_init__(self):
+        self.payment_type = _intern(self.payment_type)
+        self.method = _intern(self.method)
 
     @property
     def is_paid(self) -> bool:
@@ -214,32 +334,35 @@ class Payment:
 
     @property
     def is_overdue(self) -> bool:
-        if not self.due_date or self.is_paid:
-            return False
-        try:
-            due_date = datetime.strptime(self.due_date, '%Y-%m-%d').date()
-            return date.today() > due_date
-        except ValueError:
-            return False
+        return self.days_overdue is not None
 
     @property
     def days_overdue(self) -> Optional[int]:
-        if not self.is_overdue:
-            return None
-        try:
-            due_date = datetime.strptime(self.due_date, '%Y-%m-%d').date()
-            return (date.today() - due_date).days
-        except ValueError:
+        # A single due_date parse answers both "is it overdue" and "by how much"
+        if self.is_paid:
             return None
+        days_left = _days_until(self.due_date, date.today())
+        return -days_left if days_left is not None and days_left < 0 else None
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'id': self.id,
+            'lease_id': self.lease_id,
+            'payment_type': self.payment_type,
+            'billing_period': self.billing_period,
+            'due_date': self.due_date,
+            'amount': self.amount,
+            'method': self.method,
+            'paid_on': self.paid_on,
+            'reference_number': self.reference_number,
+            'created_at': self.created_at
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Payment':
-        return cls(**data)
+        return cls(*[data.get(name, default) for name, default in cls._FIELDS])
 
-@dataclass
+@dataclass(slots=True)
 class TicketComment:
     """Ticket comment data model"""
     id: Optional[int] = None
@@ -247,17 +370,26 @@ class TicketComment:
     author_id: int = 0
     author_type: str = ""
     comment_text: str = ""
-    created_at: Optional[str] = None
-    timestamp: Optional[str] = None
+    created_at: Optional[int] = None
+
+    def __post_init__(self):
+        self.author_type = _intern(self.author_type)
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'id': self.id,
+            'ticket_id': self.ticket_id,
+            'author_id': self.author_id,
+            'author_type': self.author_type,
+            'comment_text': self.comment_text,
+            'created_at': self.created_at
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'TicketComment':
-        return cls(**data)
+        return cls(*[data.get(name, default) for name, default in cls._FIELDS])
 
-@dataclass
+@dataclass(slots=True)
 class TicketConversation:
     """Ticket conversation data model"""
     id: Optional[int] = None
@@ -265,15 +397,30 @@ class TicketConversation:
     author_type: str = ""
     author_id: int = 0
     message_text: str = ""
-    sent_at: Optional[str] = None
-    timestamp: Optional[str] = None
+    sent_at: Optional[int] = None
+
+    def __post_init__(self):
+        self.author_type = _intern(self.author_type)
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'id': self.id,
+            'ticket_id': self.ticket_id,
+            'author_type': self.author_type,
+            'author_id': self.author_id,
+            'message_text': self.message_text,
+            'sent_at': self.sent_at
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'TicketConversation':
-        return cls(**data)
+        return cls(*[data.get(name, default) for name, default in cls._FIELDS])
+
+# (name, default) per field in declaration order, so from_dict can build
+# instances positionally without binding keyword arguments on every call
+for _model in (Tenant, Property, Unit, Lease, Agent, ServiceTicket, Payment,
+               TicketComment, TicketConversation):
+    _model._FIELDS = tuple((f.name, f.default) for f in fields(_model))
 
 class DataValidator:
     """Data validation utilities"""
@@ -281,22 +428,12 @@ class DataValidator:
     @staticmethod
     def validate_email(email: str) -> bool:
         """Basic email validation"""
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
 
     @staticmethod
     def validate_phone(phone: str) -> bool:
         """Basic Malaysian phone number validation"""
-        import re
-        # Malaysian phone patterns: 01X-XXXXXXX, +601X-XXXXXXX, etc.
-        patterns = [
-            r'^01[0-9]-[0-9]{7,8}$',  # 01X-XXXXXXX
-            r'^01[0-9][0-9]{7,8}$',   # 01XXXXXXXX
-            r'^\+601[0-9]-[0-9]{7,8}$',  # +601X-XXXXXXX
-            r'^\+601[0-9][0-9]{7,8}$'    # +601XXXXXXXX
-        ]
-        return any(re.match(pattern, phone) for pattern in patterns)
+        return bool(phone) and _PHONE_RE.match(phone) is not None
 
     @staticmethod
     def validate_date(date_str: str, format_str: str = '%Y-%m-%d') -> bool:
@@ -319,10 +456,8 @@ class DataValidator:
     @staticmethod
     def validate_postal_code(postal_code: str, country: str = 'Malaysia') -> bool:
         """Validate postal code based on country"""
-        import re
         if country.lower() == 'malaysia':
-            # Malaysian postal codes are 5 digits
-            return re.match(r'^\d{5}$', postal_code) is not None
+            return _POSTAL_MY_RE.match(postal_code) is not None
         else:
             # Generic validation - at least 3 characters
             return len(postal_code.strip()) >= 3
@@ -342,11 +477,30 @@ class ReportGenerator:
         expiring_leases = []
         total_rent_at_risk = 0.0
 
-        for lease_data in leases:
-            lease = Lease.from_dict(lease_data)
-            if lease.is_expiring_soon(days_ahead):
-                expiring_leases.append(lease_data)
-                total_rent_at_risk += lease.rent_amount
+        today = date.today()
+        pd = _pandas()
+        if pd is not None and leases:
+            import numpy as np
+
+            # Parse every end date at once; missing or malformed dates become
+            # NaT and never fall inside the window
+            end_dates = pd.to_datetime(
+                pd.Series([l.get('end_date') for l in leases], dtype=object),
+                format='%Y-%m-%d', errors='coerce'
+            ).to_numpy(dtype='datetime64[D]')
+            days_left = (end_dates - np.datetime64(today, 'D')).astype(np.int64)
+            expiring = ~np.isnat(end_dates) & (days_left >= 0) & (days_left <= days_ahead)
+            rents = np.fromiter((l.get('rent_amount', 0.0) for l in leases),
+                                dtype=np.float64, count=len(leases))
+
+            expiring_leases = [l for l, hit in zip(leases, expiring.tolist()) if hit]
+            total_rent_at_risk = float(rents[expiring].sum())
+        else:
+            for lease_data in leases:
+                days_left = _days_until(lease_data.get('end_date'), today)
+                if days_left is not None and 0 <= days_left <= days_ahead:
+                    expiring_leases.append(lease_data)
+                    total_rent_at_risk += lease_data.get('rent_amount', 0.0)
 
         return {
             'report_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
@@ -359,26 +513,45 @@ class ReportGenerator:
     @staticmethod
     def generate_payment_summary(payments: List[Dict], period: str = 'current_month') -> Dict:
         """Generate payment summary report"""
-        paid_payments = []
-        pending_payments = []
-        overdue_payments = []
-
-        total_collected = 0.0
-        total_pending = 0.0
-        total_overdue = 0.0
-
-        for payment_data in payments:
-            payment = Payment.from_dict(payment_data)
-
-            if payment.is_paid:
-                paid_payments.append(payment_data)
-                total_collected += payment.amount
-            elif payment.is_overdue:
-                overdue_payments.append(payment_data)
-                total_overdue += payment.amount
-            else:
-                pending_payments.append(payment_data)
-                total_pending += payment.amount
+        paid_payments, pending_payments, overdue_payments = details = ([], [], [])
+        total_collected = total_pending = total_overdue = 0.0
+
+        today = date.today()
+        pd = _pandas()
+        if pd is not None and payments:
+            import numpy as np
+
+            count = len(payments)
+            amounts = np.fromiter((p['amount'] for p in payments), dtype=np.float64, count=count)
+            paid_mask = np.fromiter((p.get('paid_on') is not None for p in payments), dtype=bool, count=count)
+            # Missing or malformed due dates become NaT, which never compares
+            # as overdue
+            due_dates = pd.to_datetime(
+                pd.Series([p.get('due_date') for p in payments], dtype=object),
+                format='%Y-%m-%d', errors='coerce'
+            ).to_numpy(dtype='datetime64[D]')
+            overdue_mask = ~paid_mask & (due_dates < np.datetime64(today, 'D'))
+
+            # Bucket index per row: 0 = paid, 1 = pending, 2 = overdue
+            buckets = (~paid_mask) * (1 + overdue_mask)
+            total_collected, total_pending, total_overdue = (
+                np.bincount(buckets, weights=amounts, minlength=3).astype(np.float64).tolist()
+            )
+            for payment_data, bucket in zip(payments, buckets.tolist()):
+                details[bucket].append(payment_data)
+        else:
+            for payment_data in payments:
+                if payment_data.get('paid_on') is not None:
+                    paid_payments.append(payment_data)
+                    total_collected += payment_data['amount']
+                else:
+                    days_left = _days_until(payment_data.get('due_date'), today)
+                    if days_left is not None and days_left < 0:
+                        overdue_payments.append(payment_data)
+                        total_overdue += payment_data['amount']
+                    else:
+                        pending_payments.append(payment_data)
+                        total_pending += payment_data['amount']
 
         return {
             'report_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
@@ -405,18 +578,21 @@ class ReportGenerator:
     def generate_occupancy_report(properties: List[Dict], units: List[Dict], leases: List[Dict]) -> Dict:
         """Generate property occupancy report"""
         occupancy_data = []
+        total_units_all = total_occupied_all = 0
 
-        for property_data in properties:
-            property_units = [u for u in units if u['property_id'] == property_data['id']]
-            occupied_units = 0
-
-            for unit in property_units:
-                unit_leases = [l for l in leases if l['unit_id'] == unit['id'] and l['status'] == 'active']
-                if unit_leases:
-                    occupied_units += 1
+        # Tally units and occupied units per property in two C-level Counter
+        # passes instead of rescanning per property/unit
+        active_unit_ids = {l['unit_id'] for l in leases if l.get('status') == 'active'}
+        units_per_property = Counter(unit['property_id'] for unit in units)
+        occupied_per_property = Counter(unit['property_id'] for unit in units
+                                        if unit['id'] in active_unit_ids)
 
-            total_units = len(property_units)
+        for property_data in properties:
+            total_units = units_per_property[property_data['id']]
+            occupied_units = occupied_per_property[property_data['id']]
             occupancy_rate = (occupied_units / total_units * 100) if total_units > 0 else 0
+            total_units_all += total_units
+            total_occupied_all += occupied_units
 
             occupancy_data.append({
                 'property_id': property_data['id'],
@@ -428,8 +604,6 @@ class ReportGenerator:
             })
 
         # Overall statistics
-        total_units_all = sum(p['total_units'] for p in occupancy_data)
-        total_occupied_all = sum(p['occupied_units'] for p in occupancy_data)
         overall_occupancy = (total_occupied_all / total_units_all * 100) if total_units_all > 0 else 0
 
         return {
@@ -453,18 +627,9 @@ class ReportGenerator:
             }
 
         # Analyze ticket data
-        priorities = {}
-        categories = {}
-        statuses = {}
-
-        for ticket in tickets:
-            priority = ticket.get('priority', 'normal')
-            category = ticket.get('category', 'Unknown')
-            status = ticket.get('status', 'open')
-
-            priorities[priority] = priorities.get(priority, 0) + 1
-            categories[category] = categories.get(category, 0) + 1
-            statuses[status] = statuses.get(status, 0) + 1
+        priorities = Counter(ticket.get('priority', 'normal') for ticket in tickets)
+        categories = Counter(ticket.get('category', 'Unknown') for ticket in tickets)
+        statuses = Counter(ticket.get('status', 'open') for ticket in tickets)
 
         # Generate recommendations
         recommendations = []
@@ -479,9 +644,9 @@ class ReportGenerator:
             'report_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'total_tickets': len(tickets),
             'summary': {
-                'by_priority': priorities,
-                'by_category': categories,
-                'by_status': statuses
+                'by_priority': dict(priorities),
+                'by_category': dict(categories),
+                'by_status': dict(statuses)
             },
             'recommendations': recommendations
         }
@@ -496,48 +661,30 @@ class ReportGenerator:
                 'demographics': {}
             }
 
-        age_groups = {'18-25': 0, '26-35': 0, '36-45': 0, '46-55': 0, '55+': 0, 'Unknown': 0}
-        contact_completeness = {'email_only': 0, 'phone_only': 0, 'both': 0, 'neither': 0}
+        # Seeded with zeros so every bucket appears in the report, in this order
+        age_groups = Counter({'18-25': 0, '26-35': 0, '36-45': 0, '46-55': 0, '55+': 0, 'Unknown': 0})
+        contact_completeness = Counter({'email_only': 0, 'phone_only': 0, 'both': 0, 'neither': 0})
 
         for tenant in tenants:
             # Age analysis
-            if tenant.get('date_of_birth'):
-                age = Utils.calculate_age(tenant['date_of_birth'])
-                if age:
-                    if age <= 25:
-                        age_groups['18-25'] += 1
-                    elif age <= 35:
-                        age_groups['26-35'] += 1
-                    elif age <= 45:
-                        age_groups['36-45'] += 1
-                    elif age <= 55:
-                        age_groups['46-55'] += 1
-                    else:
-                        age_groups['55+'] += 1
-                else:
-                    age_groups['Unknown'] += 1
+            age = Utils.calculate_age(tenant['date_of_birth']) if tenant.get('date_of_birth') else None
+            if age:
+                age_groups[_AGE_LABELS[bisect_left(_AGE_EDGES, age)]] += 1
             else:
                 age_groups['Unknown'] += 1
 
-            # Contact completeness
-            has_email = bool(tenant.get('email'))
-            has_phone = bool(tenant.get('phone'))
-
-            if has_email and has_phone:
-                contact_completeness['both'] += 1
-            elif has_email:
-                contact_completeness['email_only'] += 1
-            elif has_phone:
-                contact_completeness['phone_only'] += 1
-            else:
-                contact_completeness['neither'] += 1
+        # Contact completeness, keyed by (has_email, has_phone)
+        contact_completeness.update(
+            _CONTACT_COMPLETENESS[bool(tenant.get('email')), bool(tenant.get('phone'))]
+            for tenant in tenants
+        )
 
         return {
             'report_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'total_tenants': len(tenants),
             'demographics': {
-                'age_groups': age_groups,
-                'contact_completeness': contact_completeness
+                'age_groups': dict(age_groups),
+                'contact_completeness': dict(contact_completeness)
             }
         }
 
@@ -550,10 +697,14 @@ class Utils:
         return f"{currency} {amount:,.2f}"
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def format_date(date_str: str, input_format: str = '%Y-%m-%d', output_format: str = '%d/%m/%Y') -> str:
         """Format date string"""
         try:
-            date_obj = datetime.strptime(date_str, input_format)
+            if input_format == '%Y-%m-%d':
+                date_obj = date.fromisoformat(date_str)
+            else:
+                date_obj = datetime.strptime(date_str, input_format)
             return date_obj.strftime(output_format)
         except ValueError:
             return date_str
@@ -561,19 +712,19 @@ class Utils:
     @staticmethod
     def calculate_age(birth_date: str) -> Optional[int]:
         """Calculate age from birth date"""
-        try:
-            birth = datetime.strptime(birth_date, '%Y-%m-%d').date()
-            today = date.today()
-            return today.year - birth.year - ((today.month, today.day) < (birth.month, birth.day))
-        except ValueError:
-            return None
+        return _age_on(birth_date, date.today())
 
     @staticmethod
     def export_to_json(data: Any, filename: str) -> bool:
         """Export data to JSON file"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(data, default=str,
+                                         option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False, default=str)
             return True
         except Exception as e:
             print(f"Error exporting to JSON: {e}")
@@ -583,6 +734,9 @@ class Utils:
     def import_from_json(filename: str) -> Optional[Any]:
         """Import data from JSON file"""
         try:
+            if orjson is not None:
+                with open(filename, 'rb') as f:
+                    return orjson.loads(f.read())
             with open(filename, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except Exception as e:
@@ -593,8 +747,8 @@ class Utils:
     def calculate_lease_duration(start_date: str, end_date: str) -> Optional[int]:
         """Calculate lease duration in days"""
         try:
-            start = datetime.strptime(start_date, '%Y-%m-%d').date()
-            end = datetime.strptime(end_date, '%Y-%m-%d').date()
+            start = date.fromisoformat(start_date)
+            end = date.fromisoformat(end_date)
             return (end - start).days
         except ValueError:
             return None
@@ -602,17 +756,14 @@ class Utils:
     @staticmethod
     def generate_reference_number(prefix: str = "REF", length: int = 6) -> str:
         """Generate a reference number"""
-        import random
-        import string
-        suffix = ''.join(random.choices(string.digits, k=length))
-        return f"{prefix}{suffix}"
+        # One draw over the whole range, zero-padded to the requested width
+        return f"{prefix}{random.randrange(10 ** length):0{length}d}"
 
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """Sanitize filename for safe file operations"""
-        import re
         # Remove or replace invalid characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        sanitized = _FILENAME_UNSAFE_RE.sub('_', filename)
         # Remove leading/trailing spaces and dots
         sanitized = sanitized.strip(' .')
         # Limit length
@@ -652,26 +803,28 @@ class Utils:
         if not data or len(data) <= show_last:
             return data
 
-        visible_part = data[-show_last:]
-        masked_part = mask_char * (len(data) - show_last)
-        return masked_part + visible_part
+        visible_part = data[len(data) - show_last:]
+        if len(mask_char) == 1:
+            return visible_part.rjust(len(data), mask_char)
+        return mask_char * (len(data) - show_last) + visible_part
 
     @staticmethod
     def calculate_business_days(start_date: str, end_date: str) -> Optional[int]:
         """Calculate business days between two dates (excluding weekends)"""
         try:
-            start = datetime.strptime(start_date, '%Y-%m-%d').date()
-            end = datetime.strptime(end_date, '%Y-%m-%d').date()
-
-            business_days = 0
-            current_date = start
-
-            while current_date <= end:
-                if current_date.weekday() < 5:  # Monday = 0, Sunday = 6
-                    business_days += 1
-                current_date += timedelta(days=1)
-
-            return business_days
+            start = date.fromisoformat(start_date)
+            end = date.fromisoformat(end_date)
+
+            total_days = (end - start).days + 1
+            if total_days <= 0:
+                return 0
+
+            # Every full week holds five weekdays; count the leftover days
+            # individually (Monday = 0, Sunday = 6)
+            full_weeks, extra_days = divmod(total_days, 7)
+            first_weekday = start.weekday()
+            return full_weeks * 5 + sum(1 for offset in range(extra_days)
+                                        if (first_weekday + offset) % 7 < 5)
         except ValueError:
             return None
 
@@ -681,20 +834,29 @@ class DataAnalyzer:
     @staticmethod
     def calculate_revenue_trends(payments: List[Dict], months: int = 12) -> Dict:
         """Calculate revenue trends over specified months"""
-        from collections import defaultdict
-
-        monthly_revenue = defaultdict(float)
-        monthly_counts = defaultdict(int)
-
-        for payment in payments:
-            if payment.get('paid_on'):
-                try:
-                    payment_date = datetime.strptime(payment['paid_on'], '%Y-%m-%d %H:%M:%S')
-                    month_key = payment_date.strftime('%Y-%m')
-                    monthly_revenue[month_key] += payment['amount']
-                    monthly_counts[month_key] += 1
-                except ValueError:
-                    continue
+        pd = _pandas()
+        if pd is not None:
+            # Parse the whole paid_on column at once and group by month;
+            # unparseable dates become NaT and drop out of the grouping
+            paid = pd.DataFrame([(p['paid_on'], p['amount']) for p in payments if p.get('paid_on')],
+                                columns=['paid_on', 'amount'])
+            paid_on = pd.to_datetime(paid['paid_on'], format='ISO8601', errors='coerce')
+            monthly = paid['amount'].groupby(paid_on.dt.strftime('%Y-%m')).agg(['sum', 'count'])
+            monthly_revenue = dict(zip(monthly.index, monthly['sum'].tolist()))
+            monthly_counts = dict(zip(monthly.index, monthly['count'].tolist()))
+        else:
+            monthly_revenue = defaultdict(float)
+            monthly_counts = defaultdict(int)
+
+            for payment in payments:
+                if payment.get('paid_on'):
+                    try:
+                        payment_date = datetime.fromisoformat(payment['paid_on'])
+                        month_key = payment_date.strftime('%Y-%m')
+                        monthly_revenue[month_key] += payment['amount']
+                        monthly_counts[month_key] += 1
+                    except ValueError:
+                        continue
 
         # Sort by month and get last N months
         sorted_months = sorted(monthly_revenue.keys())[-months:]
@@ -713,14 +875,6 @@ class DataAnalyzer:
     @staticmethod
     def analyze_tenant_retention(leases: List[Dict]) -> Dict:
         """Analyze tenant retention patterns"""
-        tenant_lease_counts = {}
-        total_leases = len(leases)
-
-        for lease in leases:
-            tenant_id = lease.get('tenant_id')
-            if tenant_id:
-                tenant_lease_counts[tenant_id] = tenant_lease_counts.get(tenant_id, 0) + 1
-
         retention_stats = {
             'single_lease': 0,
             'multiple_leases': 0,
@@ -728,45 +882,52 @@ class DataAnalyzer:
             'retention_rate': 0.0
         }
 
-        if tenant_lease_counts:
-            retention_stats['single_lease'] = sum(1 for count in tenant_lease_counts.values() if count == 1)
-            retention_stats['multiple_leases'] = sum(1 for count in tenant_lease_counts.values() if count > 1)
-            retention_stats['max_leases_per_tenant'] = max(tenant_lease_counts.values())
-            retention_stats['retention_rate'] = (retention_stats['multiple_leases'] / len(tenant_lease_counts)) * 100
+        tenant_ids = [lease.get('tenant_id') for lease in leases if lease.get('tenant_id')]
+        if not tenant_ids:
+            return retention_stats
+
+        pd = _pandas()
+        if pd is not None:
+            lease_counts = pd.Series(tenant_ids).value_counts()
+            retention_stats['single_lease'] = int((lease_counts == 1).sum())
+            retention_stats['multiple_leases'] = int((lease_counts > 1).sum())
+            retention_stats['max_leases_per_tenant'] = int(lease_counts.max())
+        else:
+            lease_counts = Counter(tenant_ids)
+            retention_stats['single_lease'] = sum(1 for count in lease_counts.values() if count == 1)
+            retention_stats['multiple_leases'] = sum(1 for count in lease_counts.values() if count > 1)
+            retention_stats['max_leases_per_tenant'] = max(lease_counts.values())
+        retention_stats['retention_rate'] = (retention_stats['multiple_leases'] / len(lease_counts)) * 100
 
         return retention_stats
 
     @staticmethod
     def identify_maintenance_patterns(tickets: List[Dict]) -> Dict:
         """Identify patterns in maintenance requests"""
-        category_frequency = {}
-        property_issues = {}
-        seasonal_patterns = {}
+        category_frequency = Counter()
+        property_issues = defaultdict(Counter)
+        seasonal_patterns = Counter()
 
         for ticket in tickets:
             # Category analysis
             category = ticket.get('category', 'Unknown')
-            category_frequency[category] = category_frequency.get(category, 0) + 1
+            category_frequency[category] += 1
 
             # Property analysis
-            property_name = ticket.get('property_name', 'Unknown')
-            if property_name not in property_issues:
-                property_issues[property_name] = {}
-            property_issues[property_name][category] = property_issues[property_name].get(category, 0) + 1
+            property_issues[ticket.get('property_name', 'Unknown')][category] += 1
 
             # Seasonal analysis (if created_at is available)
+            # Bucketed by local month; schema v1 stores created_at as text,
+            # later versions as epoch seconds
             if ticket.get('created_at'):
-                try:
-                    created_date = datetime.strptime(ticket['created_at'], '%Y-%m-%d %H:%M:%S')
-                    month = created_date.strftime('%m')
-                    seasonal_patterns[month] = seasonal_patterns.get(month, 0) + 1
-                except ValueError:
-                    continue
+                month = Config.local_datetime(ticket['created_at']).strftime('%m')
+                seasonal_patterns[month] += 1
 
+        property_issues = {name: dict(issues) for name, issues in property_issues.items()}
         return {
-            'category_frequency': category_frequency,
+            'category_frequency': dict(category_frequency),
             'property_issues': property_issues,
-            'seasonal_patterns': seasonal_patterns,
+            'seasonal_patterns': dict(seasonal_patterns),
             'recommendations': DataAnalyzer._generate_maintenance_recommendations(category_frequency, property_issues)
         }
 
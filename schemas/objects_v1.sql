@@ -0,0 +1,45 @@
+-- Indexes and views for schema v1. Safe to re-run: applied after every
+-- rebuild and on startup so existing databases pick up new definitions.
+
+-- Indexes on foreign-key columns (SQLite does not create these itself;
+-- without them cascades and per-parent lookups scan the child table)
+CREATE INDEX IF NOT EXISTS idx_units_property    ON units(property_id);
+CREATE INDEX IF NOT EXISTS idx_leases_tenant     ON leases(tenant_id);
+CREATE INDEX IF NOT EXISTS idx_leases_unit_status ON leases(unit_id, status);
+DROP INDEX IF EXISTS idx_leases_unit;  -- superseded by idx_leases_unit_status
+CREATE INDEX IF NOT EXISTS idx_payments_lease    ON payments(lease_id);
+CREATE INDEX IF NOT EXISTS idx_tickets_lease     ON service_tickets(lease_id);
+CREATE INDEX IF NOT EXISTS idx_tickets_raised_by ON service_tickets(raised_by);
+CREATE INDEX IF NOT EXISTS idx_tickets_assigned  ON service_tickets(assigned_to);
+
+-- Per-ticket timelines: the leading ticket_id column also serves the
+-- foreign key, and the time column lets "latest N" skip the sort
+CREATE INDEX IF NOT EXISTS idx_ticket_comments_time ON ticket_comments(ticket_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_ticket_conv_time     ON ticket_conversations(ticket_id, sent_at DESC);
+
+-- Reporting filters: active leases by end date, unpaid payments by due date
+CREATE INDEX IF NOT EXISTS idx_leases_status_end  ON leases(status, end_date);
+CREATE INDEX IF NOT EXISTS idx_payments_paid_due  ON payments(paid_on, due_date);
+
+-- Monthly financial summary filters on the due month; matches the
+-- strftime('%Y-%m', due_date) expression in the query exactly
+CREATE INDEX IF NOT EXISTS idx_payments_due_month ON payments(strftime('%Y-%m', due_date));
+
+-- Lease with the tenant, unit and property details most screens need.
+-- Recreated on every run so definition changes reach existing databases.
+DROP VIEW IF EXISTS lease_full;
+CREATE VIEW lease_full AS
+SELECT l.*,
+       t.first_name AS tenant_first_name,
+       t.last_name AS tenant_last_name,
+       t.email AS tenant_email,
+       p.name AS property_name,
+       u.unit_number
+FROM leases l
+JOIN tenants t ON l.tenant_id = t.id
+JOIN units u ON l.unit_id = u.id
+JOIN properties p ON u.property_id = p.id;
+
+-- Open-ticket queue: status filter, then priority/age ordering
+CREATE INDEX IF NOT EXISTS idx_tickets_status_prio_created
+    ON service_tickets(status, priority DESC, created_at);
@@ -0,0 +1,18 @@
+-- Indexes and views for schema v2. Safe to re-run: applied after every
+-- rebuild and on startup so existing databases pick up new definitions.
+
+-- Indexes on foreign-key columns (SQLite does not create these itself;
+-- without them cascades and per-parent lookups scan the child table)
+CREATE INDEX IF NOT EXISTS idx_units_property        ON units(property_id);
+CREATE INDEX IF NOT EXISTS idx_rooms_unit            ON rooms(unit_id);
+CREATE INDEX IF NOT EXISTS idx_leases_tenant         ON leases(tenant_id);
+CREATE INDEX IF NOT EXISTS idx_leases_room           ON leases(room_id);
+CREATE INDEX IF NOT EXISTS idx_leases_agent          ON leases(agent_id);
+CREATE INDEX IF NOT EXISTS idx_maintenance_lease     ON maintenance_tickets(lease_id);
+CREATE INDEX IF NOT EXISTS idx_complaint_lease       ON complaint_tickets(lease_id);
+CREATE INDEX IF NOT EXISTS idx_payments_lease        ON payments(lease_id);
+CREATE INDEX IF NOT EXISTS idx_chat_rooms_tenant     ON chat_rooms(tenant_id);
+
+-- Chat history per room: the leading chat_room_id column also serves the
+-- foreign key, and sent_at lets "latest N" skip the sort
+CREATE INDEX IF NOT EXISTS idx_conv_msgs_room_time ON conversation_messages(chat_room_id, sent_at DESC);
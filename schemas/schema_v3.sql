@@ -0,0 +1,123 @@
+-- Schema v3: schema v1 with audit timestamps (created_at, updated_at,
+-- sent_at) stored as UTC Unix epoch seconds (requires SQLite 3.38+)
+
+-- drop old tables if they exist
+DROP TABLE IF EXISTS ticket_conversations;
+DROP TABLE IF EXISTS ticket_comments;
+DROP TABLE IF EXISTS service_tickets;
+DROP TABLE IF EXISTS payments;
+DROP TABLE IF EXISTS leases;
+DROP TABLE IF EXISTS units;
+DROP TABLE IF EXISTS agents;
+DROP TABLE IF EXISTS properties;
+DROP TABLE IF EXISTS tenants;
+
+-- tenants
+CREATE TABLE tenants (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    first_name      TEXT    NOT NULL,
+    last_name       TEXT    NOT NULL,
+    email           TEXT    UNIQUE NOT NULL,
+    phone           TEXT,
+    date_of_birth   TEXT,
+    created_at      INTEGER DEFAULT (unixepoch())
+);
+
+-- properties
+CREATE TABLE properties (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    name            TEXT    NOT NULL,
+    address_line1   TEXT    NOT NULL,
+    address_line2   TEXT,
+    city            TEXT    NOT NULL,
+    state           TEXT,
+    postal_code     TEXT,
+    country         TEXT    NOT NULL,
+    created_at      INTEGER DEFAULT (unixepoch())
+);
+
+-- units
+CREATE TABLE units (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    property_id     INTEGER NOT NULL REFERENCES properties(id) ON DELETE CASCADE,
+    unit_number     TEXT    NOT NULL,
+    floor           TEXT,
+    bedrooms        INTEGER,
+    bathrooms       REAL,
+    square_feet     INTEGER,
+    status          TEXT    DEFAULT 'available',
+    created_at      INTEGER DEFAULT (unixepoch())
+);
+
+-- leases
+CREATE TABLE leases (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    tenant_id       INTEGER NOT NULL REFERENCES tenants(id) ON DELETE CASCADE,
+    unit_id         INTEGER NOT NULL REFERENCES units(id) ON DELETE CASCADE,
+    start_date      DATETIME NOT NULL,
+    end_date        DATETIME NOT NULL,
+    rent_amount     REAL    NOT NULL,
+    security_deposit REAL,
+    status          TEXT    DEFAULT 'active',
+    created_at      INTEGER DEFAULT (unixepoch())
+);
+
+-- agents
+CREATE TABLE agents (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    first_name      TEXT,
+    last_name       TEXT,
+    role            TEXT,
+    email           TEXT    UNIQUE,
+    phone           TEXT,
+    created_at      INTEGER DEFAULT (unixepoch())
+);
+
+-- service tickets
+CREATE TABLE service_tickets (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    lease_id        INTEGER NOT NULL REFERENCES leases(id) ON DELETE CASCADE,
+    raised_by       INTEGER NOT NULL REFERENCES tenants(id) ON DELETE SET NULL,
+    assigned_to     INTEGER REFERENCES agents(id) ON DELETE SET NULL,
+    category        TEXT    NOT NULL,
+    subcategory     TEXT,
+    description     TEXT    NOT NULL,
+    status          TEXT    DEFAULT 'open',
+    priority        TEXT    DEFAULT 'normal',
+    created_at      INTEGER DEFAULT (unixepoch()),
+    updated_at      INTEGER DEFAULT (unixepoch())
+);
+
+-- ticket comments
+CREATE TABLE ticket_comments (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticket_id       INTEGER NOT NULL REFERENCES service_tickets(id) ON DELETE CASCADE,
+    author_id       INTEGER NOT NULL,
+    author_type     TEXT    NOT NULL,
+    comment_text    TEXT    NOT NULL,
+    created_at      INTEGER DEFAULT (unixepoch())
+);
+
+-- payments
+CREATE TABLE payments (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    lease_id        INTEGER NOT NULL REFERENCES leases(id) ON DELETE CASCADE,
+    payment_type    TEXT    NOT NULL,
+    billing_period  TEXT,
+    due_date        DATETIME,
+    amount          REAL    NOT NULL,
+    method          TEXT,
+    paid_on         DATETIME,
+    reference_number TEXT,
+    created_at      INTEGER DEFAULT (unixepoch())
+);
+
+-- ticket conversations
+CREATE TABLE ticket_conversations (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticket_id       INTEGER NOT NULL REFERENCES service_tickets(id) ON DELETE CASCADE,
+    author_type     TEXT    NOT NULL,
+    author_id       INTEGER NOT NULL,
+    message_text    TEXT    NOT NULL,
+    sent_at         INTEGER NOT NULL DEFAULT (unixepoch())
+);
@@ -4,6 +4,7 @@ Interactive web interface for querying property data and document analysis
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import sqlite3
 import json
@@ -12,16 +13,18 @@ import os
 import sys
 import tempfile
 import re
+from collections import Counter, deque
 from datetime import datetime, timedelta
+from itertools import islice
 import plotly.express as px
 import plotly.graph_objects as go
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 
 # Import our existing modules
 try:
-    from main import PropertyManager, DatabaseManager
+    from main import PropertyManager, DatabaseManager, PROPERTY_COLUMNS, BROWSABLE_TABLES
     from models import Utils, ReportGenerator, DataValidator, DataAnalyzer
-    from config import Config
+    from config import ACTIVE_CONFIG as Config
 except ImportError:
     st.error("Please ensure main.py, models.py, and config.py are in the same directory")
     st.stop()
@@ -34,8 +37,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Custom CSS for better styling. Streamlit drops any element a rerun does not
+# re-emit, so the style block is sent every run; it is kept to the rules
+# that still match something on the page.
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -43,54 +48,386 @@ st.markdown("""
         text-align: center;
         margin-bottom: 2rem;
     }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #1f77b4;
-    }
-    .success-message {
-        background-color: #d4edda;
-        color: #155724;
-        padding: 0.75rem;
-        border-radius: 0.25rem;
-        border: 1px solid #c3e6cb;
-    }
-    .error-message {
-        background-color: #f8d7da;
-        color: #721c24;
-        padding: 0.75rem;
-        border-radius: 0.25rem;
-        border: 1px solid #f5c6cb;
-    }
-    .sidebar .sidebar-content {
-        background-color: #f8f9fa;
-    }
     .stAlert {
         margin-top: 1rem;
     }
-    .css-1d391kg {
-        padding: 1rem;
-    }
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 24px;
-    }
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        padding: 0px 24px;
-        background-color: #f0f2f6;
-        border-radius: 8px 8px 0px 0px;
-    }
-    .stTabs [aria-selected="true"] {
-        background-color: #1f77b4;
-        color: white;
-    }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+# Fixed replies from the AI assistant, built once at import
+ASSISTANT_HELP_TEXT = """**🤖 AI Assistant Ready to Help!**
+
+I can analyze your property management data and provide insights on:
+
+**📊 Available Analysis:**
+- **Financial Performance:** Revenue trends, collection rates, payment patterns
+- **Portfolio Analytics:** Occupancy rates, property performance comparisons
+- **Tenant Insights:** Retention patterns, payment behavior, demographics
+- **Maintenance Intelligence:** Service trends, cost optimization, preventive care
+- **Predictive Modeling:** Revenue forecasts, occupancy predictions, risk assessment
+
+**💬 Try asking me:**
+- "How is our financial performance this month?"
+- "Which properties need the most attention?"
+- "What trends do you see in our payment data?"
+- "Predict our revenue for next quarter"
+- "What maintenance issues are most common?"
+
+**🎯 I can also provide:**
+- Strategic recommendations for growth
+- Risk analysis and mitigation strategies
+- Operational efficiency suggestions
+- Market insights and competitive analysis
+
+*What specific aspect of your property portfolio would you like me to analyze?*"""
+NO_OPEN_TICKETS_REPLY = "**Service & Maintenance Status:** ✅ Excellent! No open service tickets currently."
+
+# Footer markup; only the timestamp is filled in per run
+FOOTER_HTML = (
+    "<div style='text-align: center; color: #666;'>"
+    "🏢 Property Management System v1.0 | "
+    "Last updated: {updated}"
+    "</div>"
+)
+
+@st.cache_resource(show_spinner=False)
+def _get_property_manager() -> PropertyManager:
+    """One PropertyManager per process, reused by every rerun and session
+
+    cache_resource hands back the same object rather than a copy, so its
+    per-thread connections and thread pool stay open between reruns.
+    """
+    return PropertyManager()
+
+# Read-only fetches shared across reruns. Streamlit reruns the whole script on
+# every widget interaction, so identical result sets are served from cache for
+# up to a minute; mutations call st.cache_data.clear(). The underscore-prefixed
+# PropertyManager argument is excluded from the cache key.
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_tenants(_pm) -> List[Dict]:
+    return _pm.get_all_tenants()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_tenants_df(_pm) -> pd.DataFrame:
+    # Arrow-backed columns go to st.dataframe without per-cell object conversion
+    return _pm.get_all_tenants_df().convert_dtypes(dtype_backend='pyarrow')
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_properties(_pm) -> List[Dict]:
+    return _pm.get_all_properties()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_active_leases(_pm) -> List[Dict]:
+    return _pm.get_active_leases()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_expiring_leases(_pm, days_ahead: int = 30) -> List[Dict]:
+    return _pm.get_expiring_leases(days_ahead)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_lease_risk_summary(_pm, days_ahead: int = 30) -> Dict:
+    return _pm.get_lease_risk_summary(days_ahead)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_units_for_properties(_pm, property_ids: tuple) -> Dict[int, List[Dict]]:
+    return _pm.get_units_for_properties(property_ids)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_occupancy(_pm) -> pd.DataFrame:
+    """Unit counts and occupancy rate per property, from one grouped query"""
+    properties = pd.DataFrame.from_records(_pm.get_all_properties(), columns=PROPERTY_COLUMNS)
+    counts = pd.DataFrame.from_records(
+        list(_pm.get_unit_counts_by_property().values()),
+        columns=['property_id', 'total', 'occupied', 'vacant']
+    )
+    df = properties[['id', 'name']].merge(
+        counts, how='left', left_on='id', right_on='property_id'
+    ).fillna({'total': 0, 'occupied': 0, 'vacant': 0})
+    total = df['total'].to_numpy()
+    occupied = df['occupied'].to_numpy()
+    return pd.DataFrame({
+        'Property': df['name'],
+        'Total Units': total.astype(int),
+        'Occupied Units': occupied.astype(int),
+        'Vacant Units': df['vacant'].to_numpy().astype(int),
+        'Occupancy Rate': np.where(total > 0, occupied / np.maximum(total, 1) * 100, 0.0)
+    })
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_portfolio_occupancy(_pm) -> Dict:
+    return _pm.get_portfolio_occupancy()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_pending_payments_df(_pm) -> pd.DataFrame:
+    return _pm.get_pending_payments_df()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_pending_summary(_pm) -> Dict:
+    return _pm.get_pending_payments_summary()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_open_tickets(_pm) -> List[Dict]:
+    return _pm.get_open_tickets()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_ticket_priority_counts(_pm) -> Dict[str, int]:
+    return _pm.get_open_ticket_priority_counts()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_top_ticket_categories(_pm, limit: int = 1) -> List:
+    return _pm.get_top_open_ticket_categories(limit)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_financial_summary(_pm, month: str = None) -> Dict:
+    return _pm.get_financial_summary(month)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_table_preview(_pm, table_name: str) -> pd.DataFrame:
+    return _pm.get_table_preview(table_name)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_dashboard(_pm) -> Dict:
+    return _pm.dashboard(concurrent=True)
+
+def _day_diff(later, earlier) -> np.ndarray:
+    """Whole days from earlier to later, floored like Timedelta.days
+
+    Either side may be a datetime Series or a single datetime; the
+    difference is taken on the raw datetime64[ns] values. Missing dates
+    give NaN, as Series.dt.days does.
+    """
+    def as_ns(value):
+        if isinstance(value, pd.Series):
+            return value.to_numpy(dtype='datetime64[ns]')
+        return np.datetime64(value, 'ns')
+    delta = as_ns(later) - as_ns(earlier)
+    missing = np.isnat(delta)
+    if not missing.any():
+        return delta // np.timedelta64(1, 'D')
+    days = np.where(missing, np.timedelta64(0, 'D'), delta) // np.timedelta64(1, 'D')
+    return np.where(missing, np.nan, days)
+
+def _money_formatter() -> Callable[[float], str]:
+    """Formatter for amounts in the currency picked in the sidebar"""
+    return (st.session_state.get('currency', Config.CURRENCY_SYMBOL) + ' {:,.2f}').format
+
+# st.dataframe column settings, applied in the browser rather than through a
+# pandas Styler
+TENANT_COLUMN_CONFIG = {
+    'id': st.column_config.NumberColumn("ID", format="%d"),
+    'first_name': "First Name",
+    'last_name': "Last Name",
+    'email': "Email",
+    'phone': "Phone",
+    'date_of_birth': "Date of Birth",
+    'created_at': st.column_config.DatetimeColumn("Created")
+}
+PROPERTY_COLUMN_CONFIG = {
+    'id': st.column_config.NumberColumn("ID", format="%d"),
+    'name': "Name",
+    'address_line1': "Address",
+    'address_line2': "Address (cont.)",
+    'city': "City",
+    'state': "State",
+    'postal_code': "Postcode",
+    'country': "Country",
+    'created_at': st.column_config.DatetimeColumn("Created"),
+    'unit_count': st.column_config.NumberColumn("Units", format="%d")
+}
+
+def _payment_column_config() -> Dict:
+    """Column settings for payment tables, with amounts in the session currency"""
+    currency = st.session_state.get('currency', Config.CURRENCY_SYMBOL)
+    return {
+        'amount': st.column_config.NumberColumn("Amount", format=f"{currency} %.2f"),
+        'due_date': st.column_config.DateColumn("Due Date")
+    }
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _csv_gz(df: pd.DataFrame) -> bytes:
+    """Serialise a DataFrame to gzip-compressed CSV bytes in one pass"""
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding='utf-8', compression='gzip')
+    return buf.getvalue()
+
+# Most rows a table view sends to the browser; st.dataframe serialises the
+# whole frame, so longer results are cut here and the full set stays
+# available through the CSV download
+DATAFRAME_ROW_LIMIT = 5_000
+
+# Audit columns stored as UTC epoch seconds (schema v3)
+EPOCH_COLUMNS = ('created_at', 'updated_at', 'sent_at')
+
+def _localize_timestamps(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of df with epoch-second audit columns as local datetimes"""
+    epoch_columns = [
+        col for col in EPOCH_COLUMNS
+        if col in df.columns and pd.api.types.is_numeric_dtype(df[col])
+    ]
+    if not epoch_columns:
+        return df
+    return df.assign(**{
+        col: pd.to_datetime(df[col], unit='s') + Config.TIMEZONE_OFFSET
+        for col in epoch_columns
+    })
+
+def _show_dataframe(df: pd.DataFrame, **kwargs):
+    """st.dataframe over at most DATAFRAME_ROW_LIMIT rows, noting any cut
+
+    Epoch audit columns are shown as local datetimes.
+    """
+    st.dataframe(_localize_timestamps(df.iloc[:DATAFRAME_ROW_LIMIT]),
+                 use_container_width=True, **kwargs)
+    if len(df) > DATAFRAME_ROW_LIMIT:
+        st.caption(f"Showing the first {DATAFRAME_ROW_LIMIT:,} of {len(df):,} rows")
+
+# Dashboard figure builders, cached on their primitive inputs so an
+# unchanged dashboard reuses the figures from the previous rerun
+PRIORITY_COLORS = {
+    'urgent': '#FF4444',
+    'high': '#FF8800',
+    'normal': '#4CAF50',
+    'low': '#2196F3'
+}
+
+def _as_priority(priority: pd.Series) -> pd.Series:
+    """Ticket priorities as an ordered categorical, lowest first
+
+    Comparisons and counts then run on the integer codes. Values outside
+    Config.TICKET_PRIORITIES become missing.
+    """
+    return priority.astype('category').cat.set_categories(Config.TICKET_PRIORITIES, ordered=True)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _financial_pie(collected: float, pending: float) -> go.Figure:
+    fig = px.pie(
+        pd.DataFrame({'Category': ['Collected', 'Pending'], 'Amount': [collected, pending]}),
+        values='Amount',
+        names='Category',
+        title="💰 Payment Status Distribution",
+        color='Category',
+        color_discrete_map={'Collected': '#2E8B57', 'Pending': '#FF6B6B'}
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _ticket_priority_bar(priority_counts: tuple) -> go.Figure:
+    fig = px.bar(
+        pd.DataFrame(list(priority_counts), columns=['Priority', 'Count']),
+        x='Priority',
+        y='Count',
+        title="🎫 Service Tickets by Priority",
+        color='Priority',
+        color_discrete_map=PRIORITY_COLORS
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _occupancy_figures(names: tuple, totals: tuple, occupied: tuple) -> tuple:
+    """Occupancy rate and unit status bar charts for the given per-property counts"""
+    occupancy_df = pd.DataFrame({
+        'Property': names,
+        'Total Units': totals,
+        'Occupied': occupied
+    })
+    total = occupancy_df['Total Units'].to_numpy()
+    occupancy_df['Vacant'] = total - occupancy_df['Occupied']
+    occupancy_df['Occupancy Rate'] = np.where(
+        total > 0,
+        occupancy_df['Occupied'] / np.maximum(total, 1) * 100,
+        0.0
+    )
+
+    fig_occupancy = px.bar(
+        occupancy_df,
+        x='Property',
+        y='Occupancy Rate',
+        title="Occupancy Rate by Property",
+        color='Occupancy Rate',
+        color_continuous_scale='RdYlGn'
+    )
+    fig_occupancy.update_layout(height=400)
+
+    fig_units = px.bar(
+        occupancy_df,
+        x='Property',
+        y=['Occupied', 'Vacant'],
+        title="Unit Status by Property",
+        color_discrete_map={'Occupied': '#4CAF50', 'Vacant': '#FFC107'}
+    )
+    fig_units.update_layout(height=400)
+    return fig_occupancy, fig_units
+
+# Analytics figure builders. Category charts take plain tuples; the occupancy
+# charts take the occupancy frame, which st.cache_data hashes by content.
+@st.cache_data(max_entries=32, show_spinner=False)
+def _pie_chart(names: tuple, values: tuple, title: str) -> go.Figure:
+    return px.pie(values=values, names=names, title=title)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _bar_chart(x: tuple, y: tuple, title: str) -> go.Figure:
+    return px.bar(x=x, y=y, title=title)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _unit_occupancy_bar(occupancy_df: pd.DataFrame) -> go.Figure:
+    return px.bar(
+        occupancy_df,
+        x='Property',
+        y=['Occupied Units', 'Vacant Units'],
+        title="Unit Occupancy by Property"
+    )
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _occupancy_rate_bar(occupancy_df: pd.DataFrame) -> go.Figure:
+    return px.bar(
+        occupancy_df,
+        x='Property',
+        y='Occupancy Rate',
+        title="Occupancy Rate by Property",
+        color='Occupancy Rate',
+        color_continuous_scale='RdYlGn'
+    )
+
+# Keywords recognised by process_natural_language_query, matched as substrings
+# in a single scan of the query
+_QUERY_KEYWORD_RE = re.compile(
+    r'tenant|propert(?:y|ies)|payment|lease|ticket|service'
+    r'|financial|money|revenue|income|pending|occupancy|occupied|expir'
+)
+_PROPERTY_WORDS = frozenset({'property', 'properties'})
+_OCCUPANCY_WORDS = frozenset({'occupancy', 'occupied'})
+_TENANT_PAYMENT_WORDS = frozenset({'pending', 'payment'})
+_TICKET_WORDS = frozenset({'ticket', 'service'})
+_FINANCIAL_WORDS = frozenset({'financial', 'money', 'revenue', 'income'})
+
+# Keywords that route an AI assistant prompt, matched the same way
+_PROMPT_KEYWORD_RE = re.compile(r'portfolio|perform|payment|financial|maintenance|service|ticket')
+_PORTFOLIO_PROMPT_WORDS = frozenset({'portfolio', 'perform'})
+_FINANCE_PROMPT_WORDS = frozenset({'payment', 'financial'})
+_MAINTENANCE_PROMPT_WORDS = frozenset({'maintenance', 'service', 'ticket'})
 
 class StreamlitPropertyApp:
     """Main Streamlit application class"""
 
+    # Navigation sections, in display order
+    SECTIONS = (
+        "📊 Dashboard",
+        "🔍 Query Interface",
+        "📋 Data Management",
+        "📈 Analytics",
+        "💬 AI Assistant"
+    )
+
+    # Queries kept in the session's history; older entries are dropped
+    QUERY_HISTORY_SIZE = 100
+    # Chat messages kept in the session; the oldest are dropped first
+    CHAT_HISTORY_SIZE = 200
+    # Rows parsed from an uploaded CSV or Excel file for its preview
+    UPLOAD_PREVIEW_ROWS = 5
+
     def __init__(self):
         self.pm = None
         self.initialize_session_state()
@@ -103,11 +440,11 @@ class StreamlitPropertyApp:
         if 'uploaded_files' not in st.session_state:
             st.session_state.uploaded_files = []
         if 'query_history' not in st.session_state:
-            st.session_state.query_history = []
+            st.session_state.query_history = deque(maxlen=self.QUERY_HISTORY_SIZE)
         if 'data_cache' not in st.session_state:
             st.session_state.data_cache = {}
         if 'chat_messages' not in st.session_state:
-            st.session_state.chat_messages = []
+            st.session_state.chat_messages = deque(maxlen=self.CHAT_HISTORY_SIZE)
         if 'selected_property' not in st.session_state:
             st.session_state.selected_property = None
         if 'selected_tenant' not in st.session_state:
@@ -118,85 +455,111 @@ class StreamlitPropertyApp:
     def initialize_database(self):
         """Initialize database connection"""
         try:
-            self.pm = PropertyManager()
+            self.pm = _get_property_manager()
             st.session_state.db_connected = True
         except Exception as e:
             st.error(f"Database connection failed: {e}")
             st.session_state.db_connected = False
 
+    @st.fragment
     def render_sidebar(self):
-        """Render sidebar with configuration options"""
-        st.sidebar.title("🔧 Configuration")
+        """Render sidebar with configuration options
+
+        Runs as a fragment inside st.sidebar, so changing a preference
+        reruns the sidebar alone rather than the selected section. Changes
+        the main section reads (API key, provider, uploads, cleared or
+        reconnected data) trigger a full app rerun.
+        """
+        st.title("🔧 Configuration")
 
         # API Key input
-        st.sidebar.subheader("🔑 API Configuration")
-        api_key = st.sidebar.text_input(
+        st.subheader("🔑 API Configuration")
+        previous_api_key = st.session_state.api_key
+        api_key = st.text_input(
             "Enter API Key (Optional)",
             value=st.session_state.api_key,
             type="password",
             help="Enter your OpenAI, Claude, or other AI API key for enhanced features"
         )
         st.session_state.api_key = api_key
+        if api_key != previous_api_key:
+            # The AI Assistant reads the key outside this fragment
+            st.rerun()
 
         if api_key:
-            st.sidebar.success("✅ API Key configured")
+            st.success("✅ API Key configured")
 
             # API Provider selection
-            api_provider = st.sidebar.selectbox(
+            api_provider = st.selectbox(
                 "Select AI Provider:",
                 ["OpenAI", "Anthropic Claude", "Custom"],
                 help="Choose your AI service provider"
             )
+            previous_provider = st.session_state.get('api_provider')
             st.session_state.api_provider = api_provider
+            if previous_provider is not None and previous_provider != api_provider:
+                st.rerun()
 
         # File upload section
-        st.sidebar.subheader("📁 Document Upload")
-        uploaded_files = st.sidebar.file_uploader(
+        st.subheader("📁 Document Upload")
+        uploaded_files = st.file_uploader(
             "Upload documents for analysis",
             accept_multiple_files=True,
             type=['csv', 'xlsx', 'json', 'txt', 'pdf'],
             help="Upload CSV, Excel, JSON, text or PDF files"
         )
 
-        if uploaded_files:
+        uploaded_files = uploaded_files or []
+        if uploaded_files != st.session_state.uploaded_files:
+            # Data Management lists the uploads outside this fragment,
+            # including when every file has been removed
             st.session_state.uploaded_files = uploaded_files
-            st.sidebar.success(f"✅ {len(uploaded_files)} file(s) uploaded")
+            st.rerun()
+        if uploaded_files:
+            st.success(f"✅ {len(uploaded_files)} file(s) uploaded")
 
         # Database status and operations
-        st.sidebar.subheader("🗄️ Database Management")
+        st.subheader("🗄️ Database Management")
         if st.session_state.get('db_connected', False):
-            st.sidebar.success("✅ Database Connected")
+            st.success("✅ Database Connected")
 
             # Quick stats
             try:
-                tenants = self.pm.get_all_tenants()
-                properties = self.pm.get_all_properties()
-                leases = self.pm.get_active_leases()
+                tenants = _cached_tenants(self.pm)
+                properties = _cached_properties(self.pm)
+                leases = _cached_active_leases(self.pm)
 
-                st.sidebar.metric("Tenants", len(tenants))
-                st.sidebar.metric("Properties", len(properties))
-                st.sidebar.metric("Active Leases", len(leases))
+                st.metric("Tenants", len(tenants))
+                st.metric("Properties", len(properties))
+                st.metric("Active Leases", len(leases))
 
             except Exception as e:
-                st.sidebar.error(f"Error loading stats: {e}")
+                st.error(f"Error loading stats: {e}")
         else:
-            st.sidebar.error("❌ Database Not Connected")
-            if st.sidebar.button("🔄 Reconnect Database"):
+            st.error("❌ Database Not Connected")
+            if st.button("🔄 Reconnect Database"):
+                _get_property_manager.clear()
                 self.initialize_database()
+                if st.session_state.db_connected:
+                    st.rerun()
 
         # System preferences
-        st.sidebar.subheader("⚙️ Preferences")
+        st.subheader("⚙️ Preferences")
 
         # Currency setting
-        currency = st.sidebar.selectbox(
+        currency = st.selectbox(
             "Currency:",
             ["RM (Malaysian Ringgit)", "USD", "EUR", "SGD"],
             index=0
         )
+        previous_currency = st.session_state.get('currency')
         st.session_state.currency = currency.split()[0]
+        if previous_currency is not None and previous_currency != st.session_state.currency:
+            # Amounts are formatted outside this fragment; rerun the whole app
+            st.rerun()
 
         # Date format
-        date_format = st.sidebar.selectbox(
+        date_format = st.selectbox(
             "Date Format:",
             ["DD/MM/YYYY", "MM/DD/YYYY", "YYYY-MM-DD"],
             index=0
@@ -204,16 +567,42 @@ class StreamlitPropertyApp:
         st.session_state.date_format = date_format
 
         # Clear cache and reset
-        st.sidebar.subheader("🧹 System Maintenance")
-        col1, col2 = st.sidebar.columns(2)
+        st.subheader("🧹 System Maintenance")
+        col1, col2 = st.columns(2)
         with col1:
             if st.button("🗑️ Clear Cache"):
                 self.clear_cache()
-                st.success("Cache cleared!")
+                st.toast("Cache cleared!")
+                st.rerun()
         with col2:
             if st.button("🔄 Reset All"):
                 self.reset_application()
 
+        if Config.DEBUG_CACHE:
+            self.show_cache_stats()
+
+    def show_cache_stats(self):
+        """List the memory held by each st.cache_data function
+
+        Streamlit reports cache size rather than hit counts; an entry that
+        keeps growing across reruns points at an unstable cache key.
+        """
+        # Not part of Streamlit's public API, hence only behind DEBUG_CACHE
+        from streamlit.runtime.caching import get_data_cache_stats_provider
+
+        with st.expander("📊 Cache Statistics"):
+            sizes = Counter()
+            for stats in get_data_cache_stats_provider().get_stats().values():
+                for stat in stats:
+                    sizes[stat.cache_name.rsplit('.', 1)[-1]] += stat.byte_length
+            if sizes:
+                st.dataframe(
+                    pd.DataFrame(sizes.most_common(), columns=['Function', 'Bytes']),
+                    use_container_width=True, hide_index=True
+                )
+            else:
+                st.caption("No cached entries yet")
+
     def render_main_header(self):
         """Render main application header"""
         # Logo and title
@@ -225,29 +614,44 @@ class StreamlitPropertyApp:
         if st.session_state.get('db_connected', False):
             status_text = "🟢 System Online"
             try:
-                tenants_count = len(self.pm.get_all_tenants())
-                properties_count = len(self.pm.get_all_properties())
+                tenants_count = len(_cached_tenants(self.pm))
+                properties_count = len(_cached_properties(self.pm))
                 status_text += f" | {tenants_count} Tenants | {properties_count} Properties"
-            except:
+            except sqlite3.Error:
                 pass
         else:
             status_text = "🔴 System Offline"
 
         st.markdown(f"<div style='text-align: center; color: #666; margin-bottom: 1rem;'>{status_text}</div>", unsafe_allow_html=True)
 
-        # Quick navigation tabs
-        tab1, tab2, tab3, tab4, tab5 = st.tabs([
-            "📊 Dashboard",
-            "🔍 Query Interface",
-            "📋 Data Management",
-            "📈 Analytics",
-            "💬 AI Assistant"
-        ])
+        # Quick navigation; unlike st.tabs, only the selected section is rendered
+        return st.radio(
+            "Section",
+            self.SECTIONS,
+            horizontal=True,
+            key='active_tab',
+            label_visibility="collapsed"
+        )
 
-        return tab1, tab2, tab3, tab4, tab5
+    @st.fragment
+    def render_section(self, section: str):
+        """Render one navigation section as a fragment
+
+        Widgets inside the section rerun only this fragment; the sidebar,
+        header and footer are left as they are.
+        """
+        renderers = dict(zip(self.SECTIONS, (
+            self.render_dashboard,
+            self.render_query_interface,
+            self.render_data_management,
+            self.render_analytics,
+            self.render_ai_assistant
+        )))
+        renderers[section](st.container())
 
     def render_dashboard(self, tab):
             """Render main dashboard"""
+            money = _money_formatter()
             with tab:
                 if not st.session_state.get('db_connected', False):
                     st.error("Database not connected. Please check your database configuration.")
@@ -264,12 +668,15 @@ class StreamlitPropertyApp:
                 # Key metrics row
                 try:
                     # Get all data
-                    tenants = self.pm.get_all_tenants()
-                    properties = self.pm.get_all_properties()
-                    active_leases = self.pm.get_active_leases()
-                    pending_payments = self.pm.get_pending_payments()
-                    open_tickets = self.pm.get_open_tickets()
-                    financial_summary = self.pm.get_financial_summary()
+                    data = _cached_dashboard(self.pm)
+                    tenants = data['tenants']
+                    properties = data['properties']
+                    active_leases = data['active_leases']
+                    pending_summary = data['pending_summary']
+                    open_tickets = data['open_tickets']
+                    ticket_priority_counts = data['ticket_priority_counts']
+                    financial_summary = data['financial_summary']
+                    unit_counts = data['unit_counts']
 
                     # Main metrics
                     col1, col2, col3, col4, col5 = st.columns(5)
@@ -296,10 +703,9 @@ class StreamlitPropertyApp:
                         )
 
                     with col4:
-                        total_pending = sum(p['amount'] for p in pending_payments)
                         st.metric(
                             "💳 Pending Payments",
-                            f"RM {total_pending:,.2f}",
+                            money(pending_summary['total']),
                             help="Total amount in pending payments"
                         )
 
@@ -321,7 +727,7 @@ class StreamlitPropertyApp:
                         collected = financial_summary.get('total_collected', 0)
                         st.metric(
                             "Monthly Collected",
-                            f"RM {collected:,.2f}",
+                            money(collected),
                             help="Total payments received this month"
                         )
 
@@ -329,14 +735,13 @@ class StreamlitPropertyApp:
                         pending = financial_summary.get('total_pending', 0)
                         st.metric(
                             "Monthly Pending",
-                            f"RM {pending:,.2f}",
+                            money(pending),
                             help="Total payments pending this month"
                         )
 
                     with col3:
-                        total_amount = collected + pending
-                        if total_amount > 0:
-                            collection_rate = (collected / total_amount) * 100
+                        collection_rate = financial_summary['collection_rate']
+                        if collection_rate is not None:
                             delta_color = "normal" if collection_rate >= 80 else "inverse"
                             st.metric(
                                 "Collection Rate",
@@ -349,12 +754,11 @@ class StreamlitPropertyApp:
                             st.metric("Collection Rate", "0%")
 
                     with col4:
-                        overdue_payments = [p for p in pending_payments if self.is_payment_overdue(p)]
-                        overdue_amount = sum(p['amount'] for p in overdue_payments)
+                        overdue_amount = pending_summary['overdue_total']
                         st.metric(
                             "Overdue Amount",
-                            f"RM {overdue_amount:,.2f}",
-                            delta=f"{len(overdue_payments)} payments",
+                            money(overdue_amount),
+                            delta=f"{pending_summary['overdue_count']} payments",
                             delta_color="inverse" if overdue_amount > 0 else "normal",
                             help="Total overdue payment amount"
                         )
@@ -367,55 +771,14 @@ class StreamlitPropertyApp:
                     with col1:
                         # Financial summary pie chart
                         if collected > 0 or pending > 0:
-                            financial_data = pd.DataFrame({
-                                'Category': ['Collected', 'Pending'],
-                                'Amount': [collected, pending],
-                                'Color': ['#2E8B57', '#FF6B6B']
-                            })
-
-                            fig_financial = px.pie(
-                                financial_data,
-                                values='Amount',
-                                names='Category',
-                                title="💰 Payment Status Distribution",
-                                color='Category',
-                                color_discrete_map={'Collected': '#2E8B57', 'Pending': '#FF6B6B'}
-                            )
-                            fig_financial.update_layout(height=400)
-                            st.plotly_chart(fig_financial, use_container_width=True)
+                            st.plotly_chart(_financial_pie(collected, pending), use_container_width=True)
                         else:
                             st.info("No financial data available for this period")
 
                     with col2:
                         # Service tickets by priority
-                        if open_tickets:
-                            ticket_priorities = {}
-                            for ticket in open_tickets:
-                                priority = ticket.get('priority', 'normal')
-                                ticket_priorities[priority] = ticket_priorities.get(priority, 0) + 1
-
-                            # Create color mapping for priorities
-                            priority_colors = {
-                                'urgent': '#FF4444',
-                                'high': '#FF8800',
-                                'normal': '#4CAF50',
-                                'low': '#2196F3'
-                            }
-
-                            priority_df = pd.DataFrame(
-                                list(ticket_priorities.items()),
-                                columns=['Priority', 'Count']
-                            )
-
-                            fig_tickets = px.bar(
-                                priority_df,
-                                x='Priority',
-                                y='Count',
-                                title="🎫 Service Tickets by Priority",
-                                color='Priority',
-                                color_discrete_map=priority_colors
-                            )
-                            fig_tickets.update_layout(height=400)
+                        if ticket_priority_counts:
+                            fig_tickets = _ticket_priority_bar(tuple(ticket_priority_counts.items()))
                             st.plotly_chart(fig_tickets, use_container_width=True)
                         else:
                             st.info("No open service tickets")
@@ -423,49 +786,23 @@ class StreamlitPropertyApp:
                     # Property occupancy overview
                     st.subheader("🏢 Property Occupancy Overview")
 
-                    occupancy_data = []
-                    for prop in properties:
-                        units = self.pm.get_units_by_property(prop['id'])
-                        total_units = len(units)
-                        occupied_units = sum(1 for unit in units if unit.get('current_status') == 'occupied')
-                        occupancy_rate = (occupied_units / total_units * 100) if total_units > 0 else 0
-
-                        occupancy_data.append({
-                            'Property': prop['name'],
-                            'Total Units': total_units,
-                            'Occupied': occupied_units,
-                            'Vacant': total_units - occupied_units,
-                            'Occupancy Rate': occupancy_rate
-                        })
-
-                    if occupancy_data:
-                        occupancy_df = pd.DataFrame(occupancy_data)
+                    if properties:
+                        no_units = {'total': 0, 'occupied': 0}
+                        counts = [unit_counts.get(prop['id'], no_units) for prop in properties]
+                        fig_occupancy, fig_units = _occupancy_figures(
+                            tuple(prop['name'] for prop in properties),
+                            tuple(c['total'] for c in counts),
+                            tuple(c['occupied'] for c in counts)
+                        )
 
                         col1, col2 = st.columns(2)
 
                         with col1:
                             # Occupancy rate bar chart
-                            fig_occupancy = px.bar(
-                                occupancy_df,
-                                x='Property',
-                                y='Occupancy Rate',
-                                title="Occupancy Rate by Property",
-                                color='Occupancy Rate',
-                                color_continuous_scale='RdYlGn'
-                            )
-                            fig_occupancy.update_layout(height=400)
                             st.plotly_chart(fig_occupancy, use_container_width=True)
 
                         with col2:
                             # Unit status breakdown
-                            fig_units = px.bar(
-                                occupancy_df,
-                                x='Property',
-                                y=['Occupied', 'Vacant'],
-                                title="Unit Status by Property",
-                                color_discrete_map={'Occupied': '#4CAF50', 'Vacant': '#FFC107'}
-                            )
-                            fig_units.update_layout(height=400)
                             st.plotly_chart(fig_units, use_container_width=True)
 
                     # Quick actions section
@@ -490,7 +827,7 @@ class StreamlitPropertyApp:
                             st.info("Service ticket creation feature coming soon!")
 
                     # Alerts and notifications
-                    self.show_dashboard_alerts(pending_payments, active_leases, open_tickets)
+                    self.show_dashboard_alerts(pending_summary, active_leases, ticket_priority_counts)
 
                 except Exception as e:
                     st.error(f"Error loading dashboard data: {e}")
@@ -567,7 +904,7 @@ class StreamlitPropertyApp:
                     st.subheader("📜 Query History")
 
                     # Show last 10 queries
-                    for i, (timestamp, query_text, result_type) in enumerate(reversed(st.session_state.query_history[-10:])):
+                    for i, (timestamp, query_text, result_type) in enumerate(islice(reversed(st.session_state.query_history), 10)):
                         with st.expander(f"🕒 {timestamp} - {query_text[:60]}{'...' if len(query_text) > 60 else ''}"):
                             col1, col2 = st.columns([3, 1])
 
@@ -582,53 +919,53 @@ class StreamlitPropertyApp:
 
                     # Clear history option
                     if st.button("🗑️ Clear Query History"):
-                        st.session_state.query_history = []
+                        st.session_state.query_history.clear()
                         st.success("Query history cleared!")
 
     def process_natural_language_query(self, query: str):
                 """Process natural language query and return results"""
-                query_lower = query.lower()
+                keywords = set(_QUERY_KEYWORD_RE.findall(query.lower()))
                 timestamp = datetime.now().strftime("%H:%M:%S")
 
                 try:
                     # Enhanced keyword-based query processing
-                    if any(word in query_lower for word in ['tenant', 'tenants']):
-                        if 'pending' in query_lower or 'payment' in query_lower:
+                    if 'tenant' in keywords:
+                        if keywords & _TENANT_PAYMENT_WORDS:
                             self.show_tenants_with_pending_payments()
                             result_type = "Tenants with Pending Payments"
                         else:
                             self.show_all_tenants()
                             result_type = "All Tenants"
 
-                    elif any(word in query_lower for word in ['property', 'properties']):
-                        if 'occupancy' in query_lower or 'occupied' in query_lower:
+                    elif keywords & _PROPERTY_WORDS:
+                        if keywords & _OCCUPANCY_WORDS:
                             self.show_property_occupancy()
                             result_type = "Property Occupancy"
                         else:
                             self.show_all_properties()
                             result_type = "All Properties"
 
-                    elif any(word in query_lower for word in ['payment', 'payments']):
-                        if 'pending' in query_lower:
+                    elif 'payment' in keywords:
+                        if 'pending' in keywords:
                             self.show_pending_payments()
                             result_type = "Pending Payments"
                         else:
                             self.show_financial_summary()
                             result_type = "Financial Summary"
 
-                    elif any(word in query_lower for word in ['lease', 'leases']):
-                        if 'expir' in query_lower:
+                    elif 'lease' in keywords:
+                        if 'expir' in keywords:
                             self.show_expiring_leases()
                             result_type = "Expiring Leases"
                         else:
                             self.show_active_leases()
                             result_type = "Active Leases"
 
-                    elif any(word in query_lower for word in ['ticket', 'tickets', 'service']):
+                    elif keywords & _TICKET_WORDS:
                         self.show_open_tickets()
                         result_type = "Service Tickets"
 
-                    elif any(word in query_lower for word in ['financial', 'money', 'revenue', 'income']):
+                    elif keywords & _FINANCIAL_WORDS:
                         self.show_financial_summary()
                         result_type = "Financial Summary"
 
@@ -646,18 +983,16 @@ class StreamlitPropertyApp:
                   """Display all tenants"""
                   st.subheader("👥 All Tenants")
                   try:
-                      tenants = self.pm.get_all_tenants()
-                      if tenants:
-                          df = pd.DataFrame(tenants)
-                          st.dataframe(df, use_container_width=True)
+                      df = _cached_tenants_df(self.pm)
+                      if not df.empty:
+                          _show_dataframe(df, hide_index=True, column_config=TENANT_COLUMN_CONFIG)
 
                           # Download button
-                          csv = df.to_csv(index=False)
                           st.download_button(
                               label="📥 Download as CSV",
-                              data=csv,
-                              file_name=f"tenants_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                              mime="text/csv"
+                              data=_csv_gz(df),
+                              file_name=f"tenants_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv.gz",
+                              mime="application/gzip"
                           )
                       else:
                           st.info("No tenants found")
@@ -668,19 +1003,23 @@ class StreamlitPropertyApp:
                   """Display all properties"""
                   st.subheader("🏠 All Properties")
                   try:
-                      properties = self.pm.get_all_properties()
+                      properties = _cached_properties(self.pm)
                       if properties:
-                          df = pd.DataFrame(properties)
-                          st.dataframe(df, use_container_width=True)
+                          df = pd.DataFrame.from_records(
+                              properties, columns=PROPERTY_COLUMNS
+                          ).convert_dtypes(dtype_backend='pyarrow')
+                          _show_dataframe(df, hide_index=True, column_config=PROPERTY_COLUMN_CONFIG)
 
                           # Show units for each property
                           st.subheader("🏢 Units by Property")
+                          units_by_property = _cached_units_for_properties(
+                              self.pm, tuple(prop['id'] for prop in properties)
+                          )
                           for prop in properties:
                               with st.expander(f"{prop['name']} - {prop['unit_count']} units"):
-                                  units = self.pm.get_units_by_property(prop['id'])
+                                  units = units_by_property.get(prop['id'])
                                   if units:
-                                      units_df = pd.DataFrame(units)
-                                      st.dataframe(units_df, use_container_width=True)
+                                      _show_dataframe(pd.DataFrame(units))
                       else:
                           st.info("No properties found")
                   except Exception as e:
@@ -688,23 +1027,24 @@ class StreamlitPropertyApp:
 
     def show_financial_summary(self):
                   """Display financial summary"""
+                  money = _money_formatter()
                   st.subheader("💰 Financial Summary")
                   try:
-                      summary = self.pm.get_financial_summary()
+                      summary = _cached_financial_summary(self.pm)
 
                       col1, col2, col3, col4 = st.columns(4)
 
                       with col1:
                           st.metric(
                               "Total Collected",
-                              f"RM {summary.get('total_collected', 0):,.2f}",
+                              money(summary.get('total_collected', 0)),
                               help="Total payments received this month"
                           )
 
                       with col2:
                           st.metric(
                               "Total Pending",
-                              f"RM {summary.get('total_pending', 0):,.2f}",
+                              money(summary.get('total_pending', 0)),
                               help="Total payments pending this month"
                           )
 
@@ -723,9 +1063,8 @@ class StreamlitPropertyApp:
                           )
 
                       # Collection rate
-                      total_amount = summary.get('total_collected', 0) + summary.get('total_pending', 0)
-                      if total_amount > 0:
-                          collection_rate = (summary.get('total_collected', 0) / total_amount) * 100
+                      collection_rate = summary['collection_rate']
+                      if collection_rate is not None:
                           st.progress(collection_rate / 100)
                           st.write(f"**Collection Rate:** {collection_rate:.1f}%")
 
@@ -734,20 +1073,21 @@ class StreamlitPropertyApp:
 
     def show_pending_payments(self):
             """Display pending payments"""
+            money = _money_formatter()
             st.subheader("💳 Pending Payments")
             try:
-                payments = self.pm.get_pending_payments()
-                if payments:
-                    df = pd.DataFrame(payments)
-
+                df = _cached_pending_payments_df(self.pm)
+                if not df.empty:
                     # Add overdue indicator
-                    df['due_date'] = pd.to_datetime(df['due_date'])
-                    df['days_overdue'] = (datetime.now() - df['due_date']).dt.days
-                    df['status'] = df['days_overdue'].apply(
-                        lambda x: 'Overdue' if x > 0 else 'Due Soon' if x > -7 else 'Current'
+                    df['days_overdue'] = _day_diff(datetime.now(), df['due_date'])
+                    days_overdue = df['days_overdue'].to_numpy()
+                    df['status'] = np.select(
+                        [days_overdue > 0, days_overdue > -7],
+                        ['Overdue', 'Due Soon'],
+                        default='Current'
                     )
 
-                    st.dataframe(df, use_container_width=True)
+                    _show_dataframe(df, hide_index=True, column_config=_payment_column_config())
 
                     # Summary statistics
                     total_pending = df['amount'].sum()
@@ -755,9 +1095,9 @@ class StreamlitPropertyApp:
 
                     col1, col2 = st.columns(2)
                     with col1:
-                        st.metric("Total Pending", f"RM {total_pending:,.2f}")
+                        st.metric("Total Pending", money(total_pending))
                     with col2:
-                        st.metric("Overdue Amount", f"RM {overdue_amount:,.2f}")
+                        st.metric("Overdue Amount", money(overdue_amount))
 
                 else:
                     st.success("No pending payments!")
@@ -768,13 +1108,13 @@ class StreamlitPropertyApp:
         """Display expiring leases"""
         st.subheader("⚠️ Expiring Leases (Next 30 Days)")
         try:
-            leases = self.pm.get_expiring_leases(30)
+            leases = _cached_expiring_leases(self.pm, 30)
             if leases:
                 df = pd.DataFrame(leases)
-                df['end_date'] = pd.to_datetime(df['end_date'])
-                df['days_until_expiry'] = (df['end_date'] - datetime.now()).dt.days
+                df['end_date'] = pd.to_datetime(df['end_date'], format='%Y-%m-%d', cache=True)
+                df['days_until_expiry'] = _day_diff(df['end_date'], datetime.now())
 
-                st.dataframe(df, use_container_width=True)
+                _show_dataframe(df)
 
                 # Alert for urgent renewals
                 urgent_leases = df[df['days_until_expiry'] <= 7]
@@ -789,10 +1129,10 @@ class StreamlitPropertyApp:
         """Display active leases"""
         st.subheader("📋 Active Leases")
         try:
-            leases = self.pm.get_active_leases()
+            leases = _cached_active_leases(self.pm)
             if leases:
                 df = pd.DataFrame(leases)
-                st.dataframe(df, use_container_width=True)
+                _show_dataframe(df)
             else:
                 st.info("No active leases found")
         except Exception as e:
@@ -802,7 +1142,7 @@ class StreamlitPropertyApp:
         """Display open service tickets"""
         st.subheader("🎫 Open Service Tickets")
         try:
-            tickets = self.pm.get_open_tickets()
+            tickets = _cached_open_tickets(self.pm)
             if tickets:
                 df = pd.DataFrame(tickets)
 
@@ -814,23 +1154,18 @@ class StreamlitPropertyApp:
                     'urgent': '🔴'
                 }
 
-                df['priority_icon'] = df['priority'].map(priority_colors)
+                df['priority_icon'] = _as_priority(df['priority']).map(priority_colors)
 
-                st.dataframe(df, use_container_width=True)
+                _show_dataframe(df)
 
                 # Ticket statistics
-                priority_counts = df['priority'].value_counts()
+                priority_counts = Counter(ticket['priority'] for ticket in tickets)
 
                 st.subheader("📊 Ticket Statistics")
-                col1, col2, col3, col4 = st.columns(4)
-
                 priorities = ['urgent', 'high', 'normal', 'low']
-                colors = ['🔴', '🟠', '🟡', '🟢']
 
-                for i, (priority, color) in enumerate(zip(priorities, colors)):
-                    count = priority_counts.get(priority, 0)
-                    with [col1, col2, col3, col4][i]:
-                        st.metric(f"{color} {priority.title()}", count)
+                for col, priority in zip(st.columns(4), priorities):
+                    col.metric(f"{priority_colors[priority]} {priority.title()}", priority_counts[priority])
             else:
                 st.success("No open service tickets!")
         except Exception as e:
@@ -838,25 +1173,21 @@ class StreamlitPropertyApp:
 
     def show_tenants_with_pending_payments(self):
         """Display tenants with pending payments"""
+        money = _money_formatter()
         st.subheader("👥💳 Tenants with Pending Payments")
         try:
-            payments = self.pm.get_pending_payments()
-            if payments:
-                # Group by tenant
-                tenant_payments = {}
-                for payment in payments:
-                    tenant_name = payment.get('tenant_name', 'Unknown')
-                    if tenant_name not in tenant_payments:
-                        tenant_payments[tenant_name] = []
-                    tenant_payments[tenant_name].append(payment)
-
-                for tenant_name, tenant_payment_list in tenant_payments.items():
-                    total_amount = sum(p['amount'] for p in tenant_payment_list)
-
-                    with st.expander(f"{tenant_name} - RM {total_amount:,.2f} pending"):
-                        df = pd.DataFrame(tenant_payment_list)
-                        st.dataframe(df[['payment_type', 'amount', 'due_date', 'property_name']],
-                                   use_container_width=True)
+            df = _cached_pending_payments_df(self.pm)
+            if not df.empty:
+                # Group by tenant, in order of each tenant's earliest due payment
+                df['tenant_name'] = (df['tenant_first_name'] + ' ' + df['tenant_last_name']).fillna('Unknown')
+                by_tenant = df.groupby('tenant_name', sort=False)
+                totals = by_tenant['amount'].sum()
+
+                for tenant_name, tenant_df in by_tenant:
+                    with st.expander(f"{tenant_name} - {money(totals[tenant_name])} pending"):
+                        st.dataframe(tenant_df[['payment_type', 'amount', 'due_date', 'property_name']],
+                                   use_container_width=True, hide_index=True,
+                                   column_config=_payment_column_config())
             else:
                 st.success("No tenants with pending payments!")
         except Exception as e:
@@ -866,35 +1197,15 @@ class StreamlitPropertyApp:
         """Display property occupancy statistics"""
         st.subheader("🏢 Property Occupancy Analysis")
         try:
-            properties = self.pm.get_all_properties()
-            occupancy_data = []
-
-            for prop in properties:
-                units = self.pm.get_units_by_property(prop['id'])
-                total_units = len(units)
-                occupied_units = sum(1 for unit in units if unit.get('current_status') == 'occupied')
-                occupancy_rate = (occupied_units / total_units * 100) if total_units > 0 else 0
-
-                occupancy_data.append({
-                    'Property': prop['name'],
-                    'Total Units': total_units,
-                    'Occupied Units': occupied_units,
-                    'Vacant Units': total_units - occupied_units,
-                    'Occupancy Rate': f"{occupancy_rate:.1f}%"
-                })
+            df = _cached_occupancy(self.pm)
 
-            if occupancy_data:
-                df = pd.DataFrame(occupancy_data)
-                st.dataframe(df, use_container_width=True)
+            if not df.empty:
+                st.dataframe(df, use_container_width=True, column_config={
+                    'Occupancy Rate': st.column_config.NumberColumn(format="%.1f%%")
+                })
 
                 # Occupancy rate chart
-                fig = px.bar(
-                    df,
-                    x='Property',
-                    y=['Occupied Units', 'Vacant Units'],
-                    title="Unit Occupancy by Property"
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_unit_occupancy_bar(df), use_container_width=True)
             else:
                 st.info("No occupancy data available")
 
@@ -912,12 +1223,7 @@ class StreamlitPropertyApp:
                 st.subheader("📊 Raw Data Access")
 
                 # Table selection
-                table_options = [
-                    'tenants', 'properties', 'units', 'leases',
-                    'payments', 'service_tickets', 'agents'
-                ]
-
-                selected_table = st.selectbox("Select table to view:", table_options)
+                selected_table = st.selectbox("Select table to view:", BROWSABLE_TABLES)
 
                 if st.button("Load Table Data"):
                     self.show_table_data(selected_table)
@@ -955,21 +1261,17 @@ class StreamlitPropertyApp:
     def show_table_data(self, table_name: str):
         """Display raw table data"""
         try:
-            conn = self.pm.db.get_connection()
-            query = f"SELECT * FROM {table_name} LIMIT 100"
-            df = pd.read_sql_query(query, conn)
-            conn.close()
+            df = _cached_table_preview(self.pm, table_name)
 
             st.subheader(f"📊 {table_name.title()} Data")
-            st.dataframe(df, use_container_width=True)
+            _show_dataframe(df)
 
             # Download option
-            csv = df.to_csv(index=False)
             st.download_button(
                 label="📥 Download as CSV",
-                data=csv,
-                file_name=f"{table_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+                data=_csv_gz(df),
+                file_name=f"{table_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv.gz",
+                mime="application/gzip"
             )
 
         except Exception as e:
@@ -980,20 +1282,26 @@ class StreamlitPropertyApp:
         try:
             file_extension = file.name.split('.')[-1].lower()
 
+            # Only the preview rows are parsed in full; the row count
+            # re-reads the file through its first column alone
             if file_extension == 'csv':
-                df = pd.read_csv(file)
+                df = pd.read_csv(file, nrows=self.UPLOAD_PREVIEW_ROWS)
+                file.seek(0)
+                row_count = sum(len(chunk) for chunk in pd.read_csv(file, usecols=[0], chunksize=100_000))
                 st.write("**CSV File Preview:**")
-                st.dataframe(df.head(), use_container_width=True)
+                st.dataframe(df, use_container_width=True)
 
-                st.write(f"**Shape:** {df.shape[0]} rows, {df.shape[1]} columns")
+                st.write(f"**Shape:** {row_count} rows, {df.shape[1]} columns")
                 st.write("**Columns:**", list(df.columns))
 
             elif file_extension in ['xlsx', 'xls']:
-                df = pd.read_excel(file)
+                df = pd.read_excel(file, nrows=self.UPLOAD_PREVIEW_ROWS)
+                file.seek(0)
+                row_count = len(pd.read_excel(file, usecols=[0]))
                 st.write("**Excel File Preview:**")
-                st.dataframe(df.head(), use_container_width=True)
+                st.dataframe(df, use_container_width=True)
 
-                st.write(f"**Shape:** {df.shape[0]} rows, {df.shape[1]} columns")
+                st.write(f"**Shape:** {row_count} rows, {df.shape[1]} columns")
 
             elif file_extension == 'json':
                 data = json.load(file)
@@ -1015,28 +1323,21 @@ class StreamlitPropertyApp:
     def execute_sql_query(self, query: str):
         """Execute SQL query and show results"""
         try:
-            # Basic security check
-            dangerous_keywords = ['DROP', 'DELETE', 'UPDATE', 'INSERT', 'ALTER', 'CREATE']
-            query_upper = query.upper()
-
-            if any(keyword in query_upper for keyword in dangerous_keywords):
+            try:
+                df = self.pm.run_select_query(query)
+            except ValueError:
                 st.error("❌ Dangerous SQL operations are not allowed. Use SELECT queries only.")
                 return
 
-            conn = self.pm.db.get_connection()
-            df = pd.read_sql_query(query, conn)
-            conn.close()
-
             st.success("✅ Query executed successfully!")
-            st.dataframe(df, use_container_width=True)
+            _show_dataframe(df)
 
             # Download option
-            csv = df.to_csv(index=False)
             st.download_button(
                 label="📥 Download Results",
-                data=csv,
-                file_name=f"query_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+                data=_csv_gz(df),
+                file_name=f"query_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv.gz",
+                mime="application/gzip"
             )
 
         except Exception as e:
@@ -1072,48 +1373,40 @@ class StreamlitPropertyApp:
 
     def render_financial_analytics(self):
         """Render detailed financial analytics"""
+        money = _money_formatter()
         st.subheader("💰 Financial Analytics")
 
         try:
-            payments = self.pm.get_pending_payments()
-            summary = self.pm.get_financial_summary()
+            df_payments = _cached_pending_payments_df(self.pm)
+            summary = _cached_financial_summary(self.pm)
 
             # Summary metrics
             col1, col2, col3 = st.columns(3)
 
             with col1:
-                st.metric("Monthly Collected", f"RM {summary.get('total_collected', 0):,.2f}")
+                st.metric("Monthly Collected", money(summary.get('total_collected', 0)))
             with col2:
-                st.metric("Monthly Pending", f"RM {summary.get('total_pending', 0):,.2f}")
+                st.metric("Monthly Pending", money(summary.get('total_pending', 0)))
             with col3:
-                collection_rate = (summary.get('total_collected', 0) /
-                                 (summary.get('total_collected', 0) + summary.get('total_pending', 0)) * 100) if (summary.get('total_collected', 0) + summary.get('total_pending', 0)) > 0 else 0
+                collection_rate = summary['collection_rate'] or 0
                 st.metric("Collection Rate", f"{collection_rate:.1f}%")
 
             # Payment analysis charts
-            if payments:
-                df_payments = pd.DataFrame(payments)
-
+            if not df_payments.empty:
                 col1, col2 = st.columns(2)
 
                 with col1:
                     # Payment types distribution
                     payment_types = df_payments['payment_type'].value_counts()
-                    fig_types = px.pie(
-                        values=payment_types.values,
-                        names=payment_types.index,
-                        title="Pending Payments by Type"
-                    )
+                    fig_types = _pie_chart(tuple(payment_types.index), tuple(payment_types.tolist()),
+                                           "Pending Payments by Type")
                     st.plotly_chart(fig_types, use_container_width=True)
 
                 with col2:
                     # Payment amounts by property
                     property_amounts = df_payments.groupby('property_name')['amount'].sum().sort_values(ascending=False)
-                    fig_property = px.bar(
-                        x=property_amounts.index,
-                        y=property_amounts.values,
-                        title="Pending Amounts by Property"
-                    )
+                    fig_property = _bar_chart(tuple(property_amounts.index), tuple(property_amounts.tolist()),
+                                              "Pending Amounts by Property")
                     st.plotly_chart(fig_property, use_container_width=True)
 
         except Exception as e:
@@ -1124,36 +1417,12 @@ class StreamlitPropertyApp:
         st.subheader("🏢 Occupancy Analytics")
 
         try:
-            properties = self.pm.get_all_properties()
-            all_occupancy_data = []
-
-            for prop in properties:
-                units = self.pm.get_units_by_property(prop['id'])
-                total_units = len(units)
-                occupied_units = sum(1 for unit in units if unit.get('current_status') == 'occupied')
-                occupancy_rate = (occupied_units / total_units * 100) if total_units > 0 else 0
-
-                all_occupancy_data.append({
-                    'Property': prop['name'],
-                    'Total Units': total_units,
-                    'Occupied Units': occupied_units,
-                    'Vacant Units': total_units - occupied_units,
-                    'Occupancy Rate': occupancy_rate
-                })
+            df_occupancy = _cached_occupancy(self.pm)
 
-            if all_occupancy_data:
-                df_occupancy = pd.DataFrame(all_occupancy_data)
+            if not df_occupancy.empty:
 
                 # Occupancy rate chart
-                fig_occupancy = px.bar(
-                    df_occupancy,
-                    x='Property',
-                    y='Occupancy Rate',
-                    title="Occupancy Rate by Property",
-                    color='Occupancy Rate',
-                    color_continuous_scale='RdYlGn'
-                )
-                st.plotly_chart(fig_occupancy, use_container_width=True)
+                st.plotly_chart(_occupancy_rate_bar(df_occupancy), use_container_width=True)
 
                 # Detailed breakdown
                 st.dataframe(df_occupancy, use_container_width=True)
@@ -1163,33 +1432,31 @@ class StreamlitPropertyApp:
 
     def render_lease_analytics(self):
         """Render lease expiry analytics"""
+        money = _money_formatter()
         st.subheader("📋 Lease Expiry Analytics")
 
         try:
-            active_leases = self.pm.get_active_leases()
-
-            if active_leases:
-                df_leases = pd.DataFrame(active_leases)
-                df_leases['end_date'] = pd.to_datetime(df_leases['end_date'])
-                df_leases['days_until_expiry'] = (df_leases['end_date'] - datetime.now()).dt.days
-
-                # Summary metrics
-                expiring_30 = len(df_leases[df_leases['days_until_expiry'] <= 30])
-                total_rent_at_risk = df_leases[df_leases['days_until_expiry'] <= 30]['rent_amount'].sum()
+            summary = _cached_lease_risk_summary(self.pm, 30)
 
+            if summary['active_count']:
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    st.metric("Total Active Leases", len(df_leases))
+                    st.metric("Total Active Leases", summary['active_count'])
                 with col2:
-                    st.metric("Expiring in 30 days", expiring_30)
+                    st.metric("Expiring in 30 days", summary['expiring_count'])
                 with col3:
-                    st.metric("Rent at Risk (30d)", f"RM {total_rent_at_risk:,.2f}")
+                    st.metric("Rent at Risk (30d)", money(summary['rent_at_risk']))
 
                 # Detailed expiry list
                 st.subheader("⚠️ Urgent Renewals (Next 30 Days)")
-                urgent_renewals = df_leases[df_leases['days_until_expiry'] <= 30].sort_values('days_until_expiry')
-                if not urgent_renewals.empty:
-                    st.dataframe(urgent_renewals[['tenant_name', 'property_name', 'unit_number', 'end_date', 'days_until_expiry', 'rent_amount']], use_container_width=True)
+                expiring_leases = _cached_expiring_leases(self.pm, 30)
+                if expiring_leases:
+                    urgent_renewals = pd.DataFrame(expiring_leases)
+                    urgent_renewals['end_date'] = pd.to_datetime(urgent_renewals['end_date'], format='%Y-%m-%d', cache=True)
+                    urgent_renewals['days_until_expiry'] = _day_diff(urgent_renewals['end_date'], datetime.now())
+                    urgent_renewals['tenant_name'] = (urgent_renewals['tenant_first_name'] + ' ' +
+                                                      urgent_renewals['tenant_last_name'])
+                    _show_dataframe(urgent_renewals[['tenant_name', 'property_name', 'unit_number', 'end_date', 'days_until_expiry', 'rent_amount']])
                 else:
                     st.success("No urgent lease renewals needed!")
 
@@ -1198,15 +1465,14 @@ class StreamlitPropertyApp:
 
     def render_payment_analytics(self):
         """Render payment analytics"""
+        money = _money_formatter()
         st.subheader("💳 Payment Analytics")
 
         try:
-            pending_payments = self.pm.get_pending_payments()
+            df_payments = _cached_pending_payments_df(self.pm)
 
-            if pending_payments:
-                df_payments = pd.DataFrame(pending_payments)
-                df_payments['due_date'] = pd.to_datetime(df_payments['due_date'])
-                df_payments['days_overdue'] = (datetime.now() - df_payments['due_date']).dt.days
+            if not df_payments.empty:
+                df_payments['days_overdue'] = _day_diff(datetime.now(), df_payments['due_date'])
 
                 # Summary metrics
                 total_pending = df_payments['amount'].sum()
@@ -1214,17 +1480,14 @@ class StreamlitPropertyApp:
 
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.metric("Total Pending", f"RM {total_pending:,.2f}")
+                    st.metric("Total Pending", money(total_pending))
                 with col2:
-                    st.metric("Overdue Amount", f"RM {overdue_amount:,.2f}")
+                    st.metric("Overdue Amount", money(overdue_amount))
 
                 # Payment type analysis
                 type_amounts = df_payments.groupby('payment_type')['amount'].sum()
-                fig_types = px.bar(
-                    x=type_amounts.index,
-                    y=type_amounts.values,
-                    title="Pending Amounts by Payment Type"
-                )
+                fig_types = _bar_chart(tuple(type_amounts.index), tuple(type_amounts.tolist()),
+                                       "Pending Amounts by Payment Type")
                 st.plotly_chart(fig_types, use_container_width=True)
 
         except Exception as e:
@@ -1235,14 +1498,15 @@ class StreamlitPropertyApp:
         st.subheader("🎫 Service Ticket Analytics")
 
         try:
-            tickets = self.pm.get_open_tickets()
+            tickets = _cached_open_tickets(self.pm)
 
             if tickets:
                 df_tickets = pd.DataFrame(tickets)
+                df_tickets['priority'] = _as_priority(df_tickets['priority'])
 
                 # Summary metrics
                 total_tickets = len(df_tickets)
-                high_priority = len(df_tickets[df_tickets['priority'].isin(['high', 'urgent'])])
+                high_priority = int((df_tickets['priority'] >= 'high').sum())
 
                 col1, col2 = st.columns(2)
                 with col1:
@@ -1251,12 +1515,10 @@ class StreamlitPropertyApp:
                     st.metric("High Priority", high_priority)
 
                 # Priority distribution
-                priority_counts = df_tickets['priority'].value_counts()
-                fig_priority = px.pie(
-                    values=priority_counts.values,
-                    names=priority_counts.index,
-                    title="Tickets by Priority"
-                )
+                priority_counts = df_tickets['priority'].value_counts(sort=False)
+                priority_counts = priority_counts[priority_counts > 0]
+                fig_priority = _pie_chart(tuple(priority_counts.index), tuple(priority_counts.tolist()),
+                                          "Tickets by Priority")
                 st.plotly_chart(fig_priority, use_container_width=True)
 
         except Exception as e:
@@ -1298,12 +1560,12 @@ class StreamlitPropertyApp:
 
             # Chat interface
             if "chat_messages" not in st.session_state:
-                st.session_state.chat_messages = [
+                st.session_state.chat_messages = deque([
                     {
                         "role": "assistant",
                         "content": "Hello! I'm your AI Property Management Assistant. I can help you analyze your property data, generate insights, and answer questions about your portfolio. What would you like to know?"
                     }
-                ]
+                ], maxlen=self.CHAT_HISTORY_SIZE)
 
             # Display chat history
             for message in st.session_state.chat_messages:
@@ -1355,12 +1617,12 @@ class StreamlitPropertyApp:
 
             with col1:
                 if st.button("🗑️ Clear Chat History"):
-                    st.session_state.chat_messages = []
+                    st.session_state.chat_messages.clear()
                     st.rerun()
 
             with col2:
                 if st.button("📥 Export Chat"):
-                    chat_data = json.dumps(st.session_state.chat_messages, indent=2)
+                    chat_data = json.dumps(list(st.session_state.chat_messages), indent=2)
                     st.download_button(
                         label="Download Chat History",
                         data=chat_data,
@@ -1370,67 +1632,43 @@ class StreamlitPropertyApp:
 
     # Utility methods for the Streamlit app
 
-    def is_payment_overdue(self, payment: Dict) -> bool:
-        """Check if a payment is overdue"""
-        if payment.get('due_date'):
-            try:
-                due_date = datetime.strptime(payment['due_date'], '%Y-%m-%d').date()
-                return datetime.now().date() > due_date
-            except ValueError:
-                return False
-        return False
-
-    def calculate_days_overdue(self, payment: Dict) -> int:
-        """Calculate days overdue for a payment"""
-        if payment.get('due_date'):
-            try:
-                due_date = datetime.strptime(payment['due_date'], '%Y-%m-%d').date()
-                today = datetime.now().date()
-                days_diff = (today - due_date).days
-                return max(0, days_diff)
-            except ValueError:
-                return 0
-        return 0
-
-    def show_dashboard_alerts(self, pending_payments, active_leases, open_tickets):
+    def show_dashboard_alerts(self, pending_summary, active_leases, ticket_priority_counts):
         """Show important alerts on dashboard"""
+        money = _money_formatter()
         alerts = []
 
         # Check for overdue payments
-        overdue_payments = [p for p in pending_payments if self.is_payment_overdue(p)]
-        if overdue_payments:
-            total_overdue = sum(p['amount'] for p in overdue_payments)
+        if pending_summary['overdue_count']:
+            total_overdue = pending_summary['overdue_total']
             alerts.append({
                 'type': 'error',
                 'title': 'Overdue Payments',
-                'message': f"{len(overdue_payments)} payments totaling RM {total_overdue:,.2f} are overdue"
+                'message': f"{pending_summary['overdue_count']} payments totaling {money(total_overdue)} are overdue"
             })
 
-        # Check for expiring leases
-        expiring_leases = []
-        for lease in active_leases:
-            try:
-                end_date = datetime.strptime(lease['end_date'], '%Y-%m-%d').date()
-                days_until_expiry = (end_date - datetime.now().date()).days
-                if 0 <= days_until_expiry <= 30:
-                    expiring_leases.append(lease)
-            except ValueError:
-                continue
+        # Check for expiring leases; unparseable end dates become NaT and never match
+        end_dates = pd.to_datetime(
+            pd.Series([lease['end_date'] for lease in active_leases], dtype=object),
+            format='%Y-%m-%d', errors='coerce', cache=True
+        ).to_numpy(dtype='datetime64[D]')
+        days_until_expiry = (end_dates - np.datetime64(datetime.now().date())).astype(np.int64)
+        expiring = ~np.isnat(end_dates) & (days_until_expiry >= 0) & (days_until_expiry <= 30)
+        expiring_count = int(np.count_nonzero(expiring))
 
-        if expiring_leases:
+        if expiring_count:
             alerts.append({
                 'type': 'warning',
                 'title': 'Expiring Leases',
-                'message': f"{len(expiring_leases)} leases expiring within 30 days"
+                'message': f"{expiring_count} leases expiring within 30 days"
             })
 
         # Check for urgent tickets
-        urgent_tickets = [t for t in open_tickets if t.get('priority') == 'urgent']
-        if urgent_tickets:
+        urgent_count = ticket_priority_counts.get('urgent', 0)
+        if urgent_count:
             alerts.append({
                 'type': 'error',
                 'title': 'Urgent Service Tickets',
-                'message': f"{len(urgent_tickets)} urgent tickets require immediate attention"
+                'message': f"{urgent_count} urgent tickets require immediate attention"
             })
 
         # Display alerts
@@ -1446,98 +1684,107 @@ class StreamlitPropertyApp:
 
     def generate_ai_response(self, prompt: str) -> str:
         """Generate AI response (enhanced placeholder)"""
-        prompt_lower = prompt.lower()
+        money = _money_formatter()
+        keywords = set(_PROMPT_KEYWORD_RE.findall(prompt.lower()))
 
         # Enhanced response logic based on keywords and context
-        if "portfolio" in prompt_lower and "perform" in prompt_lower:
+        if _PORTFOLIO_PROMPT_WORDS <= keywords:
             try:
                 # Get comprehensive data
-                properties = self.pm.get_all_properties()
-                financial_summary = self.pm.get_financial_summary()
-                active_leases = self.pm.get_active_leases()
+                properties = _cached_properties(self.pm)
+                financial_summary = _cached_financial_summary(self.pm)
+                lease_summary = _cached_lease_risk_summary(self.pm, 30)
 
                 total_properties = len(properties)
-                total_revenue = financial_summary.get('total_collected', 0)
+                total_revenue = financial_summary['total_collected']
+                total_pending = financial_summary['total_pending']
                 occupancy_rate = self.calculate_overall_occupancy()
 
+                occupancy_label = "strong" if occupancy_rate > 85 else "moderate" if occupancy_rate > 70 else "weak"
+                revenue_label = "excellent" if total_revenue > 10000 else "good" if total_revenue > 5000 else "needs improvement"
+                strategy_advice = ("Consider rent optimization for underperforming properties" if occupancy_rate < 80
+                                   else "Maintain current strategies for optimal performance")
+                occupancy_focus = "improving occupancy rates" if occupancy_rate < 85 else "maintaining high occupancy"
+                collection_advice = ("Implement payment reminder systems" if total_pending > 5000
+                                     else "Continue current collection practices")
+
                 return f"""**Portfolio Performance Analysis:**
 
 **📊 Key Metrics:**
 - **Properties:** {total_properties} managed properties
-- **Monthly Revenue:** RM {total_revenue:,.2f}
+- **Monthly Revenue:** {money(total_revenue)}
 - **Occupancy Rate:** {occupancy_rate:.1f}%
-- **Active Leases:** {len(active_leases)}
+- **Active Leases:** {lease_summary['active_count']}
 
 **💡 Performance Insights:**
-- Your portfolio shows {"strong" if occupancy_rate > 85 else "moderate" if occupancy_rate > 70 else "weak"} occupancy performance
-- Revenue collection is {"excellent" if total_revenue > 10000 else "good" if total_revenue > 5000 else "needs improvement"}
-- {"Consider rent optimization for underperforming properties" if occupancy_rate < 80 else "Maintain current strategies for optimal performance"}
+- Your portfolio shows {occupancy_label} occupancy performance
+- Revenue collection is {revenue_label}
+- {strategy_advice}
 
 **🎯 Recommendations:**
-- Focus on {"improving occupancy rates" if occupancy_rate < 85 else "maintaining high occupancy"}
-- {"Implement payment reminder systems" if financial_summary.get('total_pending', 0) > 5000 else "Continue current collection practices"}
+- Focus on {occupancy_focus}
+- {collection_advice}
 - Regular property maintenance to ensure tenant satisfaction"""
 
             except Exception as e:
                 return f"I encountered an error analyzing your portfolio: {e}"
 
-        elif "payment" in prompt_lower or "financial" in prompt_lower:
+        elif keywords & _FINANCE_PROMPT_WORDS:
             try:
-                summary = self.pm.get_financial_summary()
-                pending_payments = self.pm.get_pending_payments()
+                summary = _cached_financial_summary(self.pm)
+                pending_summary = _cached_pending_summary(self.pm)
 
-                collection_rate = 0
-                if summary.get('total_collected', 0) + summary.get('total_pending', 0) > 0:
-                    collection_rate = (summary.get('total_collected', 0) /
-                                     (summary.get('total_collected', 0) + summary.get('total_pending', 0))) * 100
+                collected = summary['total_collected']
+                pending = summary['total_pending']
+                collection_rate = summary['collection_rate'] or 0
+                overdue_count = pending_summary['overdue_count']
 
-                overdue_count = len([p for p in pending_payments if self.is_payment_overdue(p)])
+                collection_label = "excellent" if collection_rate > 90 else "good" if collection_rate > 80 else "needs improvement"
+                reminder_advice = ("- Implement automated payment reminders" if collection_rate < 85
+                                   else "- Continue current collection strategies")
+                overdue_advice = ("- Consider payment plan options for overdue accounts" if overdue_count > 0
+                                  else "- Maintain proactive tenant communication")
 
                 return f"""**Financial Analysis & Insights:**
 
 **💰 Current Financial Status:**
-- **Monthly Collected:** RM {summary.get('total_collected', 0):,.2f}
-- **Pending Payments:** RM {summary.get('total_pending', 0):,.2f}
+- **Monthly Collected:** {money(collected)}
+- **Pending Payments:** {money(pending)}
 - **Collection Rate:** {collection_rate:.1f}%
 - **Overdue Payments:** {overdue_count} payments
 
 **📈 Performance Assessment:**
-Your collection rate of {collection_rate:.1f}% is {"excellent" if collection_rate > 90 else "good" if collection_rate > 80 else "needs improvement"}.
+Your collection rate of {collection_rate:.1f}% is {collection_label}.
 
 **🎯 Recommendations:**
-{"- Implement automated payment reminders" if collection_rate < 85 else "- Continue current collection strategies"}
-{"- Consider payment plan options for overdue accounts" if overdue_count > 0 else "- Maintain proactive tenant communication"}
+{reminder_advice}
+{overdue_advice}
 - Monitor payment patterns for early intervention opportunities
 - Consider incentives for early/on-time payments"""
 
             except Exception as e:
                 return f"I encountered an error analyzing financial data: {e}"
 
-        elif "maintenance" in prompt_lower or "service" in prompt_lower or "ticket" in prompt_lower:
+        elif keywords & _MAINTENANCE_PROMPT_WORDS:
             try:
-                tickets = self.pm.get_open_tickets()
-
-                if not tickets:
-                    return "**Service & Maintenance Status:** ✅ Excellent! No open service tickets currently."
-
-                urgent_count = len([t for t in tickets if t.get('priority') == 'urgent'])
-                high_count = len([t for t in tickets if t.get('priority') == 'high'])
+                # Counts only; the ticket rows themselves are never loaded
+                priority_counts = _cached_ticket_priority_counts(self.pm)
+                ticket_count = sum(priority_counts.values())
 
-                # Analyze categories
-                categories = {}
-                for ticket in tickets:
-                    cat = ticket.get('category', 'Unknown')
-                    categories[cat] = categories.get(cat, 0) + 1
+                if not ticket_count:
+                    return NO_OPEN_TICKETS_REPLY
 
-                most_common = max(categories, key=categories.get) if categories else "Unknown"
+                urgent_count = priority_counts.get('urgent', 0)
+                high_count = priority_counts.get('high', 0)
+                most_common, most_common_count = _cached_top_ticket_categories(self.pm, 1)[0]
 
                 return f"""**Service & Maintenance Analysis:**
 
 **🎫 Current Ticket Status:**
-- **Total Open Tickets:** {len(tickets)}
+- **Total Open Tickets:** {ticket_count}
 - **Urgent Priority:** {urgent_count} tickets
 - **High Priority:** {high_count} tickets
-- **Most Common Category:** {most_common} ({categories.get(most_common, 0)} tickets)
+- **Most Common Category:** {most_common} ({most_common_count} tickets)
 
 **⚠️ Priority Actions:**
 {f"- Immediate attention needed for {urgent_count} urgent tickets" if urgent_count > 0 else "- No urgent tickets requiring immediate attention"}
@@ -1545,57 +1792,34 @@ Your collection rate of {collection_rate:.1f}% is {"excellent" if collection_rat
 
 **💡 Maintenance Insights:**
 - {most_common} issues are most frequent - consider preventive measures
-- {"High ticket volume suggests need for additional maintenance staff" if len(tickets) > 10 else "Ticket volume is manageable with current resources"}
+- {"High ticket volume suggests need for additional maintenance staff" if ticket_count > 10 else "Ticket volume is manageable with current resources"}
 - Regular preventive maintenance can reduce emergency repairs"""
 
             except Exception as e:
                 return f"I encountered an error analyzing service tickets: {e}"
 
         else:
-            return f"""**🤖 AI Assistant Ready to Help!**
-
-I can analyze your property management data and provide insights on:
-
-**📊 Available Analysis:**
-- **Financial Performance:** Revenue trends, collection rates, payment patterns
-- **Portfolio Analytics:** Occupancy rates, property performance comparisons
-- **Tenant Insights:** Retention patterns, payment behavior, demographics
-- **Maintenance Intelligence:** Service trends, cost optimization, preventive care
-- **Predictive Modeling:** Revenue forecasts, occupancy predictions, risk assessment
-
-**💬 Try asking me:**
-- "How is our financial performance this month?"
-- "Which properties need the most attention?"
-- "What trends do you see in our payment data?"
-- "Predict our revenue for next quarter"
-- "What maintenance issues are most common?"
-
-**🎯 I can also provide:**
-- Strategic recommendations for growth
-- Risk analysis and mitigation strategies
-- Operational efficiency suggestions
-- Market insights and competitive analysis
-
-*What specific aspect of your property portfolio would you like me to analyze?*"""
+            return ASSISTANT_HELP_TEXT
 
     def calculate_overall_occupancy(self) -> float:
         """Calculate overall portfolio occupancy rate"""
         try:
-            properties = self.pm.get_all_properties()
-            total_units = 0
-            occupied_units = 0
-
-            for prop in properties:
-                units = self.pm.get_units_by_property(prop['id'])
-                total_units += len(units)
-                occupied_units += sum(1 for unit in units if unit.get('current_status') == 'occupied')
+            counts = _cached_portfolio_occupancy(self.pm)
+            total_units = counts['total']
+            occupied_units = counts['occupied']
 
             return (occupied_units / total_units * 100) if total_units > 0 else 0
-        except:
+        except sqlite3.Error:
             return 0
 
+    @st.fragment
     def show_add_tenant_form(self):
-        """Show form to add new tenant"""
+        """Show form to add new tenant
+
+        As a fragment, submitting the form reruns only the form, so it is
+        still on screen, and the submission is handled, even though the
+        button that opened it is no longer pressed.
+        """
         with st.form("add_tenant_form"):
             st.subheader("➕ Add New Tenant")
 
@@ -1632,6 +1856,7 @@ I can analyze your property management data and provide insights on:
                             date_of_birth=date_of_birth.strftime('%Y-%m-%d') if date_of_birth else None
                         )
 
+                        st.cache_data.clear()
                         st.success(f"✅ Tenant added successfully! ID: {tenant_id}")
 
                     except Exception as e:
@@ -1641,41 +1866,33 @@ I can analyze your property management data and provide insights on:
 
     def clear_cache(self):
         """Clear application cache"""
-        st.session_state.data_cache = {}
-        st.session_state.query_history = []
+        st.cache_data.clear()
+        st.session_state.data_cache.clear()
+        st.session_state.query_history.clear()
         if 'chat_messages' in st.session_state:
-            st.session_state.chat_messages = []
+            st.session_state.chat_messages.clear()
 
     def reset_application(self):
         """Reset all application state"""
-        for key in list(st.session_state.keys()):
-            del st.session_state[key]
+        st.session_state.clear()
         st.rerun()
 
     def run(self):
         """Main application runner"""
         # Render sidebar
-        self.render_sidebar()
+        with st.sidebar:
+            self.render_sidebar()
 
         # Render main content
-        tab1, tab2, tab3, tab4, tab5 = self.render_main_header()
+        section = self.render_main_header()
 
-        # Render each tab
-        self.render_dashboard(tab1)
-        self.render_query_interface(tab2)
-        self.render_data_management(tab3)
-        self.render_analytics(tab4)
-        self.render_ai_assistant(tab5)
+        # Render the selected section only
+        self.render_section(section)
 
         # Footer
         st.markdown("---")
-        st.markdown(
-            "<div style='text-align: center; color: #666;'>"
-            "🏢 Property Management System v1.0 | "
-            f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            "</div>",
-            unsafe_allow_html=True
-        )
+        st.markdown(FOOTER_HTML.format(updated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+                    unsafe_allow_html=True)
 
 
 def main():